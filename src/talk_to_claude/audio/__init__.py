@@ -1,5 +1,5 @@
 """Audio capture module."""
 
-from .capture import AudioCapture
+from .capture import AudioCapture, InputDevice
 
-__all__ = ["AudioCapture"]
+__all__ = ["AudioCapture", "InputDevice"]
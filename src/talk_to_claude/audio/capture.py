@@ -1,9 +1,7 @@
 """Audio capture from microphone using sounddevice."""
 
 import asyncio
-import queue
-import threading
-from typing import AsyncIterator
+from typing import AsyncIterator, NamedTuple
 
 import numpy as np
 import sounddevice as sd
@@ -11,15 +9,30 @@ import sounddevice as sd
 from ..utils.logger import get_logger
 
 
+class InputDevice(NamedTuple):
+    """An audio input device reported by sounddevice."""
+
+    index: int
+    name: str
+    channels: int
+    sample_rate: float
+
+
 class AudioCapture:
     """Captures audio from the microphone for streaming to transcription service."""
 
+    # Number of callback blocks held by the capture ring buffer. The
+    # PortAudio callback runs on a thread in this process, so the ring is
+    # plain process memory shared with the event loop without any IPC.
+    RING_SLOTS = 100
+
     def __init__(
         self,
         sample_rate: int = 16000,
         channels: int = 1,
         chunk_duration_ms: int = 100,
         dtype: str = "int16",
+        batch_factor: int = 1,
     ):
         """Initialize audio capture.
 
@@ -28,14 +41,25 @@ class AudioCapture:
             channels: Number of audio channels (1 for mono)
             chunk_duration_ms: Duration of each audio chunk in milliseconds
             dtype: Audio data type (int16 for 16-bit PCM)
+            batch_factor: Number of chunks delivered per PortAudio callback.
+                Larger values mean fewer callbacks but add latency.
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_duration_ms = chunk_duration_ms
         self.dtype = dtype
+        self.batch_factor = max(1, batch_factor)
         self.chunk_size = int(sample_rate * chunk_duration_ms / 1000)
-
-        self._audio_queue: queue.Queue[bytes] = queue.Queue()
+        self.block_size = self.chunk_size * self.batch_factor
+
+        # Ring buffer of captured blocks; the event wakes the consumer once
+        # the write index moves past the read index
+        self._ring: np.ndarray | None = None
+        self._slot_views: list[memoryview] = []
+        self._write_idx = 0
+        self._read_idx = 0
+        self._has_data = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._stream: sd.InputStream | None = None
         self._running = False
         self._logger = get_logger("audio.capture")
@@ -58,34 +82,54 @@ class AudioCapture:
         if status:
             self._logger.warning(f"Audio callback status: {status}")
 
-        # Convert to bytes and add to queue
-        audio_bytes = indata.tobytes()
+        # Slots between the read and write indices are still owned by the consumer
+        write_idx = self._write_idx
+        if write_idx - self._read_idx >= self.RING_SLOTS:
+            self._logger.warning("Audio ring buffer full, dropping block")
+            return
+
+        # Copy into the ring slot (plain buffer memcpy, no NumPy dispatch),
+        # publish it and wake the event loop thread
+        self._slot_views[write_idx % self.RING_SLOTS][:] = memoryview(indata).cast("B")
+        self._write_idx = write_idx + 1
         try:
-            self._audio_queue.put_nowait(audio_bytes)
-        except queue.Full:
-            self._logger.warning("Audio queue full, dropping chunk")
+            self._loop.call_soon_threadsafe(self._has_data.set)
+        except RuntimeError:
+            # Event loop already closed during shutdown
+            pass
 
     def start(self) -> None:
-        """Start capturing audio from the default microphone."""
+        """Start capturing audio from the default microphone.
+
+        Must be called from the event loop that consumes get_audio_stream().
+        """
         if self._running:
             self._logger.warning("Audio capture already running")
             return
 
         self._running = True
-        self._audio_queue = queue.Queue(maxsize=100)
+        self._loop = asyncio.get_running_loop()
+        self._has_data = asyncio.Event()
+        self._ring = np.empty(
+            (self.RING_SLOTS, self.block_size * self.channels), dtype=self.dtype
+        )
+        self._slot_views = [memoryview(slot).cast("B") for slot in self._ring]
+        self._write_idx = 0
+        self._read_idx = 0
 
         try:
             self._stream = sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=self.channels,
                 dtype=self.dtype,
-                blocksize=self.chunk_size,
+                blocksize=self.block_size,
                 callback=self._audio_callback,
             )
             self._stream.start()
             self._logger.info(
                 f"Audio capture started: {self.sample_rate}Hz, "
-                f"{self.channels}ch, {self.chunk_duration_ms}ms chunks"
+                f"{self.channels}ch, {self.chunk_duration_ms}ms chunks "
+                f"x{self.batch_factor} per callback"
             )
         except Exception as e:
             self._running = False
@@ -104,37 +148,43 @@ class AudioCapture:
             self._stream.close()
             self._stream = None
 
-        # Clear the queue
-        while not self._audio_queue.empty():
-            try:
-                self._audio_queue.get_nowait()
-            except queue.Empty:
-                break
+        # Wake up any consumer waiting in get_audio_stream; unread blocks
+        # are simply abandoned in the ring
+        self._has_data.set()
 
         self._logger.info("Audio capture stopped")
 
-    async def get_audio_stream(self) -> AsyncIterator[bytes]:
+    async def get_audio_stream(self) -> AsyncIterator[memoryview]:
         """Async generator that yields audio chunks.
 
+        Each chunk is a zero-copy view into the capture ring buffer; blocks
+        captured with batch_factor > 1 are sliced into chunk_duration_ms
+        pieces. A block's slot is released once its last chunk has been
+        consumed, so consumers must finish with (or copy) a chunk before
+        advancing the iterator.
+
         Yields:
-            Audio data as bytes
+            Audio data as a byte-format memoryview
         """
-        loop = asyncio.get_event_loop()
+        chunk_bytes = self.chunk_size * self.channels * np.dtype(self.dtype).itemsize
 
         while self._running:
-            try:
-                # Use run_in_executor to avoid blocking the event loop
-                audio_chunk = await loop.run_in_executor(
-                    None, self._audio_queue.get, True, 0.1
-                )
-                yield audio_chunk
-            except queue.Empty:
-                # No audio available, continue waiting
-                continue
-            except Exception as e:
-                if self._running:
-                    self._logger.error(f"Error getting audio chunk: {e}")
-                break
+            await self._has_data.wait()
+            # Clear before draining so a block published mid-drain re-arms it
+            self._has_data.clear()
+
+            while self._running and self._read_idx < self._write_idx:
+                read_idx = self._read_idx
+                block = self._slot_views[read_idx % self.RING_SLOTS]
+                for offset in range(0, len(block), chunk_bytes):
+                    yield block[offset:offset + chunk_bytes]
+
+                # Release the slot back to the capture callback
+                self._read_idx = read_idx + 1
+
+                # Draining does not suspend, so yield to the event loop
+                # explicitly to keep bursts from starving other tasks
+                await asyncio.sleep(0)
 
     @property
     def is_running(self) -> bool:
@@ -142,20 +192,14 @@ class AudioCapture:
         return self._running
 
     @staticmethod
-    def list_devices() -> list[dict]:
+    def list_devices() -> list[InputDevice]:
         """List available audio input devices.
 
         Returns:
-            List of device information dictionaries
+            List of InputDevice entries
         """
-        devices = sd.query_devices()
-        input_devices = []
-        for i, device in enumerate(devices):
-            if device["max_input_channels"] > 0:
-                input_devices.append({
-                    "index": i,
-                    "name": device["name"],
-                    "channels": device["max_input_channels"],
-                    "sample_rate": device["default_samplerate"],
-                })
-        return input_devices
+        return [
+            InputDevice(i, d["name"], d["max_input_channels"], d["default_samplerate"])
+            for i, d in enumerate(sd.query_devices())
+            if d["max_input_channels"] > 0
+        ]
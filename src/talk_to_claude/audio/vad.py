@@ -35,6 +35,9 @@ class VoiceActivityDetector:
         self.silence_duration_ms = silence_duration_ms
 
         self._frame_size = int(sample_rate * frame_duration_ms / 1000)
+        # Squared threshold in raw int16 units so frames need no normalization
+        # and the comparison needs no sqrt
+        self._sq_threshold = (energy_threshold * 32768.0) ** 2
         self._silence_frames = int(silence_duration_ms / frame_duration_ms)
         self._consecutive_silence = 0
         self._is_speaking = False
@@ -69,32 +72,32 @@ class VoiceActivityDetector:
         Returns:
             True if speech is detected in this frame
         """
-        # Convert bytes to numpy array
-        audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
+        # View bytes as int16 samples (no copy)
+        audio_array = np.frombuffer(audio_data, dtype=np.int16)
 
-        # Normalize to [-1, 1]
-        audio_array = audio_array / 32768.0
-
-        # Calculate RMS energy
-        rms_energy = np.sqrt(np.mean(audio_array ** 2))
-
-        # Determine if speech is present
-        is_speech = rms_energy > self.energy_threshold
+        # Exact sum of squares in a single fused pass over the int16 samples,
+        # accumulated in int64 (no widened copy, float conversion or sqrt),
+        # compared against the squared RMS threshold scaled by frame length
+        sum_squares = int(np.einsum("i,i->", audio_array, audio_array, dtype=np.int64))
+        is_speech = sum_squares > self._sq_threshold * len(audio_array)
 
+        # Work on a local copy of the silence counter and store it once
+        consecutive_silence = self._consecutive_silence
         if is_speech:
-            self._consecutive_silence = 0
+            consecutive_silence = 0
             if not self._is_speaking:
                 self._is_speaking = True
                 self._logger.debug("Speech started")
                 if self._on_speech_start:
                     self._on_speech_start()
         else:
-            self._consecutive_silence += 1
-            if self._is_speaking and self._consecutive_silence >= self._silence_frames:
+            consecutive_silence += 1
+            if self._is_speaking and consecutive_silence >= self._silence_frames:
                 self._is_speaking = False
                 self._logger.debug("Speech ended")
                 if self._on_speech_end:
                     self._on_speech_end()
+        self._consecutive_silence = consecutive_silence
 
         return is_speech
 
@@ -1,7 +1,8 @@
 """iTerm2 controller for session management and text injection."""
 
 import asyncio
-from typing import Callable, List, Optional
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
 import iterm2
 
@@ -13,12 +14,20 @@ from .position_detector import PositionDetector, SessionPosition
 class ITermController:
     """Controls iTerm2 sessions via the Python API."""
 
+    # How long a Claude-session check result stays valid (seconds)
+    CLAUDE_CHECK_TTL = 5.0
+
+    # Upper bound on a whole Claude-session scan (seconds)
+    CLAUDE_SCAN_TIMEOUT = 2.0
+
     def __init__(self):
         self._connection: iterm2.Connection | None = None
         self._app: iterm2.App | None = None
         self._position_detector = PositionDetector()
         self._logger = get_logger("iterm.controller")
         self._connected = False
+        # session_id -> (checked_at, session title at check time, is_claude)
+        self._claude_cache: Dict[str, Tuple[float, str, bool]] = {}
 
     async def connect(self) -> None:
         """Connect to iTerm2 application.
@@ -44,8 +53,18 @@ class ITermController:
         self._connected = False
         self._connection = None
         self._app = None
+        self._claude_cache.clear()
         self._logger.info("Disconnected from iTerm2")
 
+    @property
+    def app(self) -> Optional[iterm2.App]:
+        """The iTerm2 app handle resolved at connect time.
+
+        The iterm2 library keeps it up to date through its own
+        subscriptions, so it is reused for the whole connection.
+        """
+        return self._app
+
     async def get_current_tab(self) -> Optional[iterm2.Tab]:
         """Get the currently active tab.
 
@@ -81,23 +100,111 @@ class ITermController:
         Returns:
             List of sessions running Claude Code
         """
-        all_sessions = await self.get_all_sessions()
-        claude_sessions = []
+        return [session for session, _ in await self.get_claude_sessions_with_tabs()]
+
+    async def get_claude_sessions_with_tabs(self) -> List[Tuple[iterm2.Session, iterm2.Tab]]:
+        """Find all sessions running Claude Code along with their tabs.
 
-        for session in all_sessions:
-            if await self._is_claude_session(session):
-                claude_sessions.append(session)
+        Walks the app's windows and tabs once, so callers don't need a
+        second traversal to locate each session's tab.
 
-        return claude_sessions
+        Returns:
+            List of (session, tab) pairs for sessions running Claude Code
+        """
+        sessions, _ = await self.scan_claude_sessions()
+        return sessions
 
-    async def _is_claude_session(self, session: iterm2.Session) -> bool:
+    async def scan_claude_sessions(
+        self,
+    ) -> Tuple[List[Tuple[iterm2.Session, iterm2.Tab]], bool]:
+        """Find all sessions running Claude Code and report whether all were checked.
+
+        Returns:
+            Tuple of (session, tab) pairs for sessions running Claude Code,
+            and False if any check timed out or failed, in which case the
+            pairs may be missing Claude sessions
+        """
+        if not self._app:
+            return [], False
+
+        candidates = [
+            (session, tab)
+            for window in self._app.windows
+            for tab in window.tabs
+            for session in tab.sessions
+        ]
+
+        # Forget cached checks for sessions that no longer exist
+        live_ids = {session.session_id for session, _ in candidates}
+        for session_id in self._claude_cache.keys() - live_ids:
+            del self._claude_cache[session_id]
+
+        if not candidates:
+            return [], True
+
+        # Check all sessions concurrently under one shared time budget so a
+        # slow profile RPC can't stall the scan
+        tasks = [
+            asyncio.create_task(self._is_claude_session(session))
+            for session, _ in candidates
+        ]
+        done, pending = await asyncio.wait(tasks, timeout=self.CLAUDE_SCAN_TIMEOUT)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self._logger.debug("%d session checks timed out", len(pending))
+
+        # A check that didn't finish cleanly leaves its session unresolved
+        results = [
+            task.result() if task in done and task.exception() is None else None
+            for task in tasks
+        ]
+        complete = all(result is not None for result in results)
+        sessions = [
+            candidate
+            for candidate, result in zip(candidates, results)
+            if result is True
+        ]
+        return sessions, complete
+
+    async def _is_claude_session(self, session: iterm2.Session) -> Optional[bool]:
         """Check if a session is running Claude Code.
 
         Args:
             session: Session to check
 
         Returns:
-            True if session is running Claude Code
+            True if session is running Claude Code, None if that couldn't
+            be determined
+        """
+        # The session title is available locally, so it is checked before
+        # the cache and a title that turns into "claude" is seen at once
+        session_title = session.name or ""
+        if "claude" in session_title.lower():
+            return True
+
+        # Cached profile checks only hold while the title is unchanged
+        session_id = session.session_id
+        cached = self._claude_cache.get(session_id)
+        now = time.monotonic()
+        if cached and cached[1] == session_title and now - cached[0] < self.CLAUDE_CHECK_TTL:
+            return cached[2]
+
+        is_claude = await self._check_claude_profile(session)
+        # Failed checks aren't cached, so the next scan retries them
+        if is_claude is not None:
+            self._claude_cache[session_id] = (now, session_title, is_claude)
+        return is_claude
+
+    async def _check_claude_profile(self, session: iterm2.Session) -> Optional[bool]:
+        """Query the session's profile to determine whether it runs Claude Code.
+
+        Args:
+            session: Session to check
+
+        Returns:
+            True if session is running Claude Code, None if the profile
+            couldn't be read
         """
         try:
             # Get the session's current command/process name with timeout
@@ -106,23 +213,14 @@ class ITermController:
             )
             name = profile.name if profile else ""
 
-            # Check session name or command for "claude"
-            if "claude" in name.lower():
-                return True
-
-            # Alternative: Check the session's title/name
-            session_title = session.name or ""
-            if "claude" in session_title.lower():
-                return True
-
             # Could also check running process, but this requires more setup
-            return False
+            return "claude" in name.lower()
         except asyncio.TimeoutError:
             self._logger.debug("Timeout checking session profile")
-            return False
+            return None
         except Exception as e:
-            self._logger.debug(f"Error checking session: {e}")
-            return False
+            self._logger.debug("Error checking session: %s", e)
+            return None
 
     async def get_session_positions(self, tab: iterm2.Tab) -> List[SessionPosition]:
         """Get position information for all sessions in a tab.
@@ -151,7 +249,15 @@ class ITermController:
             Session at position or None
         """
         positions = await self.get_session_positions(tab)
-        return self._position_detector.find_session_by_position(positions, position)
+        session_id = self._position_detector.find_session_by_position(positions, position)
+        if session_id is None:
+            return None
+
+        # Positions carry only ids; resolve the match back to its session
+        for session in tab.sessions:
+            if session.session_id == session_id:
+                return session
+        return None
 
     async def activate_session(self, session: iterm2.Session) -> None:
         """Bring a session to focus.
@@ -177,7 +283,7 @@ class ITermController:
         """
         try:
             await asyncio.wait_for(session.async_send_text(text), timeout=2.0)
-            self._logger.debug(f"Sent text to session {session.session_id}: {text[:50]}...")
+            self._logger.debug("Sent text to session %s: %.50s...", session.session_id, text)
         except asyncio.TimeoutError:
             self._logger.warning("Timeout sending text to session")
         except Exception as e:
@@ -216,6 +322,52 @@ class ITermController:
         """
         return len(tab.sessions)
 
+    async def watch_topology(self, on_change: Callable[[], None]) -> None:
+        """Call on_change whenever sessions, layouts or session titles change.
+
+        Subscribes to iTerm2 new-session, session-termination, layout-change
+        and session name notifications. Runs until cancelled or until one
+        subscription fails, and stops all of them either way.
+
+        Args:
+            on_change: Callback invoked (without arguments) on each notification
+
+        Raises:
+            Exception: Whatever the failing subscription raised
+        """
+        if not self._connection:
+            return
+        connection = self._connection
+
+        async def forward(make_monitor: Callable[[], object]) -> None:
+            async with make_monitor() as mon:
+                while True:
+                    await mon.async_get()
+                    on_change()
+
+        tasks = [
+            asyncio.create_task(forward(make_monitor))
+            for make_monitor in (
+                lambda: iterm2.NewSessionMonitor(connection),
+                lambda: iterm2.SessionTerminationMonitor(connection),
+                lambda: iterm2.LayoutChangeMonitor(connection),
+                lambda: iterm2.VariableMonitor(
+                    connection, iterm2.VariableScopes.SESSION, "name", "all"
+                ),
+            )
+        ]
+        try:
+            # Monitors only return by failing; the first failure ends the watch
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            # Stop the remaining monitors whether one failed or the watch was
+            # cancelled, so none outlives the caller
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
     @property
     def is_connected(self) -> bool:
         """Check if connected to iTerm2."""
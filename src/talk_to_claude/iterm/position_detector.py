@@ -1,20 +1,26 @@
 """Position detection for iTerm2 split panes."""
 
+import dataclasses
+import functools
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import iterm2
 
 from ..transcription.command_parser import HorizontalPosition, VerticalPosition, WindowPosition
 from ..utils.logger import get_logger
 
+# Hashable splitter-tree fingerprint: a session_id for a leaf, or
+# (vertical, child_layouts) for a splitter
+Layout = Union[str, Tuple[bool, Tuple["Layout", ...]]]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class SessionPosition:
     """Position information for a session in the split layout."""
 
-    session: iterm2.Session
+    session_id: str
     horizontal: HorizontalPosition
     vertical: VerticalPosition
     row: int  # 0-indexed row position
@@ -26,11 +32,61 @@ class SessionPosition:
         return WindowPosition(horizontal=self.horizontal, vertical=self.vertical)
 
 
+@dataclass
+class PositionIndex:
+    """Lookup tables from positions to session ids, built once per layout.
+
+    Each table keeps the first session (in grid order) for its key, which
+    matches the order the linear scans used to return.
+    """
+
+    exact: Dict[Tuple[HorizontalPosition, VerticalPosition], str]
+    by_horizontal: Dict[HorizontalPosition, str]
+    by_vertical: Dict[VerticalPosition, str]
+
+    @classmethod
+    def build(cls, positions: List[SessionPosition]) -> "PositionIndex":
+        """Build the lookup tables for a list of positions.
+
+        Args:
+            positions: List of session positions in grid order
+
+        Returns:
+            PositionIndex for the positions
+        """
+        exact: Dict[Tuple[HorizontalPosition, VerticalPosition], str] = {}
+        by_horizontal: Dict[HorizontalPosition, str] = {}
+        by_vertical: Dict[VerticalPosition, str] = {}
+        for pos in positions:
+            exact.setdefault((pos.horizontal, pos.vertical), pos.session_id)
+            by_horizontal.setdefault(pos.horizontal, pos.session_id)
+            by_vertical.setdefault(pos.vertical, pos.session_id)
+        return cls(exact=exact, by_horizontal=by_horizontal, by_vertical=by_vertical)
+
+
 class PositionDetector:
     """Detects positions of sessions in iTerm2 split pane layouts."""
 
+    # Position of the only session in an unsplit tab
+    _SINGLE_PANE_POS = SessionPosition(
+        session_id="",
+        horizontal=HorizontalPosition.CENTER,
+        vertical=VerticalPosition.MIDDLE,
+        row=0,
+        col=0,
+    )
+
     def __init__(self):
         self._logger = get_logger("iterm.position")
+        # Memoized layout -> positions computation (per instance, bounded).
+        # Positions hold only session ids, so a cached list is reusable for
+        # as long as the layout is unchanged
+        self._cached_layout_positions = functools.lru_cache(maxsize=16)(
+            self._compute_layout_positions
+        )
+        # Index for the most recently searched positions list
+        self._last_positions: Optional[List[SessionPosition]] = None
+        self._last_index: Optional[PositionIndex] = None
 
     def compute_positions(
         self,
@@ -44,199 +100,204 @@ class PositionDetector:
         Returns:
             List of SessionPosition objects
         """
+        if isinstance(root, iterm2.Splitter) and len(root.children) == 1:
+            # A splitter wrapping a single session lays out like no split
+            only_child = root.children[0]
+            if isinstance(only_child, iterm2.Session):
+                root = only_child
+
         if isinstance(root, iterm2.Session):
             # Single session, no splits
-            return [
-                SessionPosition(
-                    session=root,
-                    horizontal=HorizontalPosition.CENTER,
-                    vertical=VerticalPosition.MIDDLE,
-                    row=0,
-                    col=0,
-                )
-            ]
+            return [dataclasses.replace(self._SINGLE_PANE_POS, session_id=root.session_id)]
 
-        # Build grid representation
-        grid = self._build_grid(root)
-        return self._grid_to_positions(grid)
+        return self._cached_layout_positions(self._layout_fingerprint(root))
 
-    def _build_grid(
+    def _layout_fingerprint(
         self,
-        splitter: iterm2.Splitter,
-        row_start: int = 0,
-        col_start: int = 0,
-    ) -> List[List[Optional[iterm2.Session]]]:
-        """Recursively build a grid representation of the split layout.
+        node: Union[iterm2.Splitter, iterm2.Session],
+    ) -> Layout:
+        """Reduce a splitter tree to a hashable layout fingerprint.
+
+        Sessions become their session_id; splitters become
+        (vertical, child_fingerprints) tuples.
 
         Args:
-            splitter: Splitter to process
-            row_start: Starting row index
-            col_start: Starting column index
+            node: Splitter or session to fingerprint
 
         Returns:
-            2D grid of sessions
+            Layout fingerprint
         """
-        children = splitter.children
-        is_vertical = splitter.vertical  # True = children arranged left to right
-
-        if is_vertical:
-            # Horizontal split: children are columns
-            grids = []
-            for child in children:
-                if isinstance(child, iterm2.Session):
-                    grids.append([[child]])
-                else:
-                    grids.append(self._build_grid(child))
-
-            # Merge horizontally: each child becomes a column
-            return self._merge_horizontal(grids)
-        else:
-            # Vertical split: children are rows
-            grids = []
-            for child in children:
-                if isinstance(child, iterm2.Session):
-                    grids.append([[child]])
-                else:
-                    grids.append(self._build_grid(child))
-
-            # Merge vertically: stack rows
-            return self._merge_vertical(grids)
-
-    def _merge_horizontal(
-        self, grids: List[List[List[Optional[iterm2.Session]]]]
-    ) -> List[List[Optional[iterm2.Session]]]:
-        """Merge grids horizontally (side by side)."""
-        if not grids:
-            return []
-
-        # Find maximum number of rows across all grids
-        max_rows = max(len(g) for g in grids)
-
-        result = []
-        for row_idx in range(max_rows):
-            row = []
-            for grid in grids:
-                if row_idx < len(grid):
-                    row.extend(grid[row_idx])
-                else:
-                    # Pad with None if this grid doesn't have this row
-                    cols = len(grid[0]) if grid else 1
-                    row.extend([None] * cols)
-            result.append(row)
-
-        return result
-
-    def _merge_vertical(
-        self, grids: List[List[List[Optional[iterm2.Session]]]]
-    ) -> List[List[Optional[iterm2.Session]]]:
-        """Merge grids vertically (stacked)."""
-        if not grids:
-            return []
-
-        # Find maximum number of columns across all grids
-        max_cols = max(len(g[0]) if g else 1 for g in grids)
-
-        result = []
-        for grid in grids:
-            for row in grid:
-                # Pad row to max_cols if needed
-                padded_row = row + [None] * (max_cols - len(row))
-                result.append(padded_row)
-
-        return result
-
-    def _grid_to_positions(
-        self, grid: List[List[Optional[iterm2.Session]]]
-    ) -> List[SessionPosition]:
-        """Convert grid representation to SessionPosition list.
+        if isinstance(node, iterm2.Session):
+            return node.session_id
+
+        return (
+            node.vertical,
+            tuple(self._layout_fingerprint(child) for child in node.children),
+        )
+
+    def _compute_layout_positions(self, layout: Layout) -> List[SessionPosition]:
+        """Compute session positions for a layout fingerprint.
+
+        Pure with respect to the fingerprint, so results are memoized; the
+        returned list is shared between calls and must not be mutated.
 
         Args:
-            grid: 2D grid of sessions
+            layout: Layout fingerprint of a splitter
 
         Returns:
-            List of SessionPosition objects
+            List of SessionPosition objects in row-major order
         """
-        if not grid or not grid[0]:
-            return []
-
-        num_rows = len(grid)
-        num_cols = len(grid[0])
+        placed: List[Tuple[int, int, str]] = []
+        num_rows, num_cols = self._walk(layout, placed)
+        placed.sort()
 
         positions = []
-        seen_sessions = set()
-
-        for row_idx, row in enumerate(grid):
-            for col_idx, session in enumerate(row):
-                if session is None:
-                    continue
-                if session.session_id in seen_sessions:
-                    continue
-                seen_sessions.add(session.session_id)
-
-                # Determine horizontal position
-                if num_cols == 1:
-                    h_pos = HorizontalPosition.CENTER
-                elif col_idx == 0:
-                    h_pos = HorizontalPosition.LEFT
-                elif col_idx == num_cols - 1:
-                    h_pos = HorizontalPosition.RIGHT
-                else:
-                    h_pos = HorizontalPosition.CENTER
-
-                # Determine vertical position
-                if num_rows == 1:
-                    v_pos = VerticalPosition.MIDDLE
-                elif row_idx == 0:
-                    v_pos = VerticalPosition.UPPER
-                elif row_idx == num_rows - 1:
-                    v_pos = VerticalPosition.LOWER
-                else:
-                    v_pos = VerticalPosition.MIDDLE
-
-                positions.append(
-                    SessionPosition(
-                        session=session,
-                        horizontal=h_pos,
-                        vertical=v_pos,
-                        row=row_idx,
-                        col=col_idx,
-                    )
+        for row_idx, col_idx, session_id in placed:
+            # Determine horizontal position
+            if num_cols == 1:
+                h_pos = HorizontalPosition.CENTER
+            elif col_idx == 0:
+                h_pos = HorizontalPosition.LEFT
+            elif col_idx == num_cols - 1:
+                h_pos = HorizontalPosition.RIGHT
+            else:
+                h_pos = HorizontalPosition.CENTER
+
+            # Determine vertical position
+            if num_rows == 1:
+                v_pos = VerticalPosition.MIDDLE
+            elif row_idx == 0:
+                v_pos = VerticalPosition.UPPER
+            elif row_idx == num_rows - 1:
+                v_pos = VerticalPosition.LOWER
+            else:
+                v_pos = VerticalPosition.MIDDLE
+
+            positions.append(
+                SessionPosition(
+                    session_id=session_id,
+                    horizontal=h_pos,
+                    vertical=v_pos,
+                    row=row_idx,
+                    col=col_idx,
                 )
+            )
 
         return positions
 
+    def _walk(
+        self,
+        layout: Layout,
+        placed: List[Tuple[int, int, str]],
+    ) -> Tuple[int, int]:
+        """Place every session of a layout on the grid in one preorder walk.
+
+        A subtree occupies a rows x cols block: columns add up across a
+        vertical splitter (children left to right) and rows add up across a
+        horizontal one, with the other dimension taken from the largest child.
+        Each session is placed at the top-left cell of its own block.
+
+        The walk uses an explicit stack rather than recursion, so deep
+        splits cost no Python frame per splitter.
+
+        Args:
+            layout: Layout fingerprint to place at the grid origin
+            placed: Populated with (row, col, session_id) for every session
+
+        Returns:
+            (rows, cols) spanned by the layout
+        """
+        # One frame per open splitter:
+        # [is_vertical, children, row, col, next_child, rows, cols]
+        stack: List[list] = []
+        node, row, col = layout, 0, 0
+
+        while True:
+            if isinstance(node, str):
+                placed.append((row, col, node))
+                size: Optional[Tuple[int, int]] = (1, 1)
+            else:
+                is_vertical, children = node
+                stack.append([is_vertical, children, row, col, 0, 0, 0])
+                size = None
+
+            # Fold finished subtrees into their parents until a frame has
+            # another child to descend into
+            while True:
+                if size is not None:
+                    if not stack:
+                        return size
+                    frame = stack[-1]
+                    child_rows, child_cols = size
+                    if frame[0]:
+                        # Children are columns
+                        frame[5] = max(frame[5], child_rows)
+                        frame[6] += child_cols
+                    else:
+                        # Children are rows
+                        frame[5] += child_rows
+                        frame[6] = max(frame[6], child_cols)
+                    frame[4] += 1
+
+                frame = stack[-1]
+                if frame[4] < len(frame[1]):
+                    node = frame[1][frame[4]]
+                    if frame[0]:
+                        row, col = frame[2], frame[3] + frame[6]
+                    else:
+                        row, col = frame[2] + frame[5], frame[3]
+                    break
+
+                stack.pop()
+                size = (frame[5], frame[6])
+
     def find_session_by_position(
         self,
         positions: List[SessionPosition],
         target: WindowPosition,
-    ) -> Optional[iterm2.Session]:
-        """Find session matching the target position.
+    ) -> Optional[str]:
+        """Find the session matching the target position.
 
         Args:
             positions: List of session positions
             target: Target position to find
 
         Returns:
-            Matching session or None
+            session_id of the matching session or None
         """
+        index = self._get_index(positions)
+
         # First try exact match
-        for pos in positions:
-            if (pos.horizontal == target.horizontal and
-                pos.vertical == target.vertical):
-                return pos.session
+        session_id = index.exact.get((target.horizontal, target.vertical))
+        if session_id is not None:
+            return session_id
 
         # Try partial matches (e.g., just horizontal or just vertical)
         # Prioritize horizontal match if vertical is CENTER/MIDDLE
         if target.vertical == VerticalPosition.MIDDLE:
-            for pos in positions:
-                if pos.horizontal == target.horizontal:
-                    return pos.session
+            session_id = index.by_horizontal.get(target.horizontal)
+            if session_id is not None:
+                return session_id
 
         # Prioritize vertical match if horizontal is CENTER
         if target.horizontal == HorizontalPosition.CENTER:
-            for pos in positions:
-                if pos.vertical == target.vertical:
-                    return pos.session
+            session_id = index.by_vertical.get(target.vertical)
+            if session_id is not None:
+                return session_id
 
         self._logger.warning(f"No session found for position: {target}")
         return None
+
+    def _get_index(self, positions: List[SessionPosition]) -> PositionIndex:
+        """Get the lookup index for a positions list, reusing the last one.
+
+        Args:
+            positions: List of session positions
+
+        Returns:
+            PositionIndex for the positions
+        """
+        if positions is not self._last_positions:
+            self._last_index = PositionIndex.build(positions)
+            self._last_positions = positions
+        return self._last_index
@@ -34,35 +34,46 @@ class SessionManager:
         self._controller = controller
         self._sessions: Dict[str, ManagedSession] = {}
         self._active_session_id: Optional[str] = None
+        # Topology fingerprint of the last full scan
+        self._last_fingerprint: Optional[int] = None
         self._logger = get_logger("iterm.session_manager")
 
-    async def refresh_sessions(self) -> None:
-        """Scan for Claude Code sessions across all tabs."""
+    async def refresh_sessions(self, force: bool = False) -> None:
+        """Scan for Claude Code sessions across all tabs.
+
+        Args:
+            force: Scan even if the topology fingerprint is unchanged, to
+                catch changes a missed notification would otherwise hide
+        """
         if not self._controller.is_connected:
             self._logger.warning("Controller not connected, cannot refresh sessions")
             return
 
-        # Get all Claude sessions
-        claude_sessions = await self._controller.get_claude_sessions()
+        # Skip the scan entirely when windows, tabs and sessions are unchanged
+        fingerprint = self._topology_fingerprint()
+        if not force and fingerprint is not None and fingerprint == self._last_fingerprint:
+            return
+
+        # Get all Claude sessions with the tabs containing them. The
+        # fingerprint is only kept once every session has been checked, so
+        # a failed or partial scan is retried on the next refresh.
+        self._last_fingerprint = None
+        claude_sessions, complete = await self._controller.scan_claude_sessions()
+        if complete:
+            self._last_fingerprint = fingerprint
 
         # Update our session tracking
-        current_ids = set()
-        for session in claude_sessions:
-            session_id = session.session_id
-            current_ids.add(session_id)
-
-            if session_id not in self._sessions:
-                # Find the tab containing this session
-                tab = await self._find_session_tab(session)
-                if tab:
-                    self._sessions[session_id] = ManagedSession(
-                        session=session,
-                        tab=tab,
-                    )
-                    self._logger.info(f"Registered new Claude session: {session_id}")
+        current = {session.session_id: (session, tab) for session, tab in claude_sessions}
+        for session_id in current.keys() - self._sessions.keys():
+            session, tab = current[session_id]
+            self._sessions[session_id] = ManagedSession(
+                session=session,
+                tab=tab,
+            )
+            self._logger.info(f"Registered new Claude session: {session_id}")
 
         # Remove sessions that no longer exist
-        removed = set(self._sessions.keys()) - current_ids
+        removed = self._sessions.keys() - current.keys()
         for session_id in removed:
             del self._sessions[session_id]
             self._logger.info(f"Removed Claude session: {session_id}")
@@ -72,21 +83,39 @@ class SessionManager:
         # Update positions for all sessions
         await self._update_positions()
 
-    async def _find_session_tab(self, session: iterm2.Session) -> Optional[iterm2.Tab]:
-        """Find the tab containing a session.
+    def _topology_fingerprint(self) -> Optional[int]:
+        """Hash the window/tab/session topology of the app.
 
-        Args:
-            session: Session to find tab for
+        Titles of sessions not yet known to be Claude sessions are included,
+        since a title change can make them one. Known Claude sessions only
+        contribute whether their title still mentions Claude: Claude Code
+        animates its title, and hashing every frame would force a full
+        rescan each time, but quitting Claude must still trigger one.
 
         Returns:
-            Tab containing the session or None
+            Fingerprint hash or None if the app is unavailable
         """
-        app = await iterm2.async_get_app(self._controller._connection)
-        for window in app.windows:
-            for tab in window.tabs:
-                if session in tab.sessions:
-                    return tab
-        return None
+        app = self._controller.app
+        if not app:
+            return None
+
+        known = self._sessions
+        return hash(tuple(
+            (
+                window.window_id,
+                tab.tab_id,
+                tuple(
+                    (
+                        s.session_id,
+                        "claude" in (s.name or "").lower()
+                        if s.session_id in known else s.name,
+                    )
+                    for s in tab.sessions
+                ),
+            )
+            for window in app.windows
+            for tab in window.tabs
+        ))
 
     async def _update_positions(self) -> None:
         """Update position information for all managed sessions."""
@@ -98,18 +127,21 @@ class SessionManager:
                 tabs[tab_id] = []
             tabs[tab_id].append(managed)
 
+        # Fetch positions for all tabs concurrently
+        tab_sessions = list(tabs.values())
+        results = await asyncio.gather(*(
+            self._controller.get_session_positions(managed_sessions[0].tab)
+            for managed_sessions in tab_sessions
+        ))
+
         # Update positions for each tab
-        for tab_id, managed_sessions in tabs.items():
-            if managed_sessions:
-                tab = managed_sessions[0].tab
-                positions = await self._controller.get_session_positions(tab)
-
-                # Map positions to managed sessions
-                for pos in positions:
-                    for managed in managed_sessions:
-                        if managed.session.session_id == pos.session.session_id:
-                            managed.position = pos
-                            break
+        for managed_sessions, positions in zip(tab_sessions, results):
+            # Map positions to managed sessions
+            by_id = {m.session.session_id: m for m in managed_sessions}
+            for pos in positions:
+                managed = by_id.get(pos.session_id)
+                if managed is not None:
+                    managed.position = pos
 
     async def get_session_for_position(
         self,
@@ -139,7 +171,7 @@ class SessionManager:
         Returns:
             Active session or None
         """
-        # Always check current focused session first (not cached)
+        # Always check current focused session first
         tab = await self._controller.get_current_tab()
         if tab:
             current = tab.current_session
@@ -153,7 +185,7 @@ class SessionManager:
 
         # Fall back to single session if only one exists
         if len(self._sessions) == 1:
-            session = list(self._sessions.values())[0].session
+            session = next(iter(self._sessions.values())).session
             self._active_session_id = session.session_id
             return session
 
@@ -196,16 +228,22 @@ class SessionManager:
         """
         return [m.session for m in self._sessions.values()]
 
-    async def send_text_to_active(self, text: str) -> bool:
+    async def send_text_to_active(
+        self,
+        text: str,
+        session: Optional[iterm2.Session] = None,
+    ) -> bool:
         """Send text to the active session.
 
         Args:
             text: Text to send
+            session: Already-resolved active session; looked up if omitted
 
         Returns:
             True if text was sent successfully
         """
-        session = await self.get_active_session()
+        if session is None:
+            session = await self.get_active_session()
         if not session:
             self._logger.warning("No active session to send text to")
             return False
@@ -213,16 +251,22 @@ class SessionManager:
         await self._controller.send_text(session, text)
         return True
 
-    async def submit_to_active(self, text: str) -> bool:
+    async def submit_to_active(
+        self,
+        text: str,
+        session: Optional[iterm2.Session] = None,
+    ) -> bool:
         """Send text with newline (submit) to the active session.
 
         Args:
             text: Text to submit
+            session: Already-resolved active session; looked up if omitted
 
         Returns:
             True if text was submitted successfully
         """
-        session = await self.get_active_session()
+        if session is None:
+            session = await self.get_active_session()
         if not session:
             self._logger.warning("No active session to submit to")
             return False
@@ -2,9 +2,12 @@
 
 import argparse
 import asyncio
+import functools
 import os
+import select
 import signal
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -12,9 +15,9 @@ from .audio.capture import AudioCapture
 from .iterm.controller import ITermController
 from .iterm.session_manager import SessionManager
 from .transcription.base import BaseTranscriber
-from .transcription.command_parser import CommandParser, CommandType
+from .transcription.command_parser import CommandParser, CommandType, ParseResult
 from .transcription.factory import create_transcriber
-from .ui.overlay import TranscriptOverlay
+from .ui.overlay import CHILD_MODULE, TranscriptOverlay
 from .utils.config import Config
 from .utils.logger import setup_logger, get_logger
 
@@ -30,6 +33,7 @@ class TalkToClaudeDaemon:
         """
         self.config = config
         self._logger = get_logger("daemon")
+        self._pid_path = Path(config.daemon["pid_file"])
 
         # Components
         self._audio: Optional[AudioCapture] = None
@@ -41,9 +45,14 @@ class TalkToClaudeDaemon:
 
         # State
         self._running = False
-        self._text_buffer = ""
+        self._text_chunks: list[str] = []
+        # Buffered text size that triggers an automatic submit
+        self._max_buffer_chars = 4096
         self._shutdown_event = asyncio.Event()
         self._session_refresh_task: Optional[asyncio.Task] = None
+        # Parsed final transcripts, handled in order by a single worker
+        self._action_queue: asyncio.Queue[ParseResult] = asyncio.Queue()
+        self._action_task: Optional[asyncio.Task] = None
 
     async def start(self) -> None:
         """Start the daemon and all components."""
@@ -79,6 +88,7 @@ class TalkToClaudeDaemon:
             sample_rate=audio_config["sample_rate"],
             channels=audio_config["channels"],
             chunk_duration_ms=audio_config["chunk_duration_ms"],
+            batch_factor=audio_config.get("batch_factor", 1),
         )
 
         # Transcription service (Deepgram, ElevenLabs, or OpenAI)
@@ -104,10 +114,11 @@ class TalkToClaudeDaemon:
 
         # Command parser
         cmd_config = self.config.commands
-        self._parser = CommandParser(
+        self._parser = CommandParser.get(
             end_voice_phrase=cmd_config.get("end_voice_phrase", "end voice"),
             additional_end_phrases=cmd_config.get("additional_end_phrases"),
         )
+        self._max_buffer_chars = cmd_config.get("max_buffer_chars", 4096)
 
         # iTerm2 controller and session manager
         self._iterm = ITermController()
@@ -136,28 +147,30 @@ class TalkToClaudeDaemon:
 
     def _setup_signal_handlers(self) -> None:
         """Set up signal handlers for graceful shutdown."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         for sig in (signal.SIGTERM, signal.SIGINT):
-            loop.add_signal_handler(sig, self._signal_handler)
+            loop.add_signal_handler(sig, functools.partial(self._signal_handler, sig))
 
-    def _signal_handler(self) -> None:
-        """Handle shutdown signals."""
-        self._logger.info("Received shutdown signal")
+    def _signal_handler(self, sig: signal.Signals) -> None:
+        """Handle shutdown signals.
+
+        Args:
+            sig: Signal that triggered the shutdown
+        """
+        self._logger.info(f"Received shutdown signal ({sig.name})")
         self._shutdown_event.set()
 
     def _write_pid_file(self) -> None:
         """Write PID file for daemon management."""
-        pid_file = Path(self.config.daemon["pid_file"])
-        pid_file.parent.mkdir(parents=True, exist_ok=True)
-        pid_file.write_text(str(os.getpid()))
-        self._logger.debug(f"PID file written: {pid_file}")
+        self._pid_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pid_path.write_text(str(os.getpid()))
+        self._logger.debug("PID file written: %s", self._pid_path)
 
     def _remove_pid_file(self) -> None:
         """Remove PID file."""
-        pid_file = Path(self.config.daemon["pid_file"])
-        if pid_file.exists():
-            pid_file.unlink()
+        if self._pid_path.exists():
+            self._pid_path.unlink()
             self._logger.debug("PID file removed")
 
     async def _main_loop(self) -> None:
@@ -168,8 +181,11 @@ class TalkToClaudeDaemon:
         # Start transcription streaming
         await self._transcriber.start_streaming()
 
-        # Start periodic session refresh task
-        self._session_refresh_task = asyncio.create_task(self._periodic_session_refresh())
+        # Start event-driven session refresh task
+        self._session_refresh_task = asyncio.create_task(self._session_refresh_loop())
+
+        # Start the transcript action worker
+        self._action_task = asyncio.create_task(self._action_worker())
 
         # Show listening indicator
         if self._overlay:
@@ -178,16 +194,23 @@ class TalkToClaudeDaemon:
         self._logger.info("Listening for voice input...")
 
         try:
-            # Stream audio to transcriber
-            async for audio_chunk in self._audio.get_audio_stream():
-                if self._shutdown_event.is_set():
-                    break
-
-                await self._transcriber.send_audio(audio_chunk)
+            await self._stream_audio()
 
         except asyncio.CancelledError:
             self._logger.info("Main loop cancelled")
         finally:
+            # Let queued actions finish, then stop the worker
+            if self._action_task:
+                try:
+                    await asyncio.wait_for(self._action_queue.join(), timeout=2.0)
+                except asyncio.TimeoutError:
+                    self._logger.warning("Pending transcript actions dropped on shutdown")
+                self._action_task.cancel()
+                try:
+                    await self._action_task
+                except asyncio.CancelledError:
+                    pass
+
             # Cancel session refresh task
             if self._session_refresh_task:
                 self._session_refresh_task.cancel()
@@ -196,41 +219,106 @@ class TalkToClaudeDaemon:
                 except asyncio.CancelledError:
                     pass
 
-    async def _periodic_session_refresh(self) -> None:
-        """Periodically refresh sessions to detect new/closed Claude sessions."""
-        refresh_interval = 5.0  # seconds
+    async def _stream_audio(self) -> None:
+        """Hand captured audio chunks to the transcriber until shutdown.
+
+        The transcriber's send buffer queues each chunk without waiting on
+        the connection (dropping the oldest when it falls behind), so a
+        stalled send doesn't hold up reading from the capture ring.
+        """
+        async for audio_chunk in self._audio.get_audio_stream():
+            if self._shutdown_event.is_set():
+                break
+            await self._transcriber.send_audio(audio_chunk)
+
+    async def _session_refresh_loop(self) -> None:
+        """Refresh sessions on iTerm2 notifications to detect new/closed Claude sessions.
+
+        Falls back to a slow heartbeat refresh in case a notification is
+        missed or the subscription fails. The heartbeat forces a full rescan
+        on its own schedule, even while notifications keep arriving.
+        """
+        heartbeat_interval = 60.0  # seconds
+        debounce = 0.25  # seconds to let bursts of notifications settle
+
+        changed = asyncio.Event()
+        watcher = asyncio.create_task(self._watch_iterm_changes(changed))
+        last_forced = time.monotonic()
 
         try:
             while not self._shutdown_event.is_set():
-                await asyncio.sleep(refresh_interval)
+                remaining = heartbeat_interval - (time.monotonic() - last_forced)
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=max(remaining, 0.0))
+                    await asyncio.sleep(debounce)
+                except asyncio.TimeoutError:
+                    pass
 
                 if self._shutdown_event.is_set():
                     break
 
-                try:
-                    previous_count = self._session_manager.get_session_count()
-                    await self._session_manager.refresh_sessions()
-                    current_count = self._session_manager.get_session_count()
-
-                    # Log changes in session count
-                    if current_count != previous_count:
-                        self._logger.info(
-                            f"Session count changed: {previous_count} -> {current_count}"
-                        )
-
-                        # Update overlay if no sessions
-                        if current_count == 0 and self._overlay:
-                            self._overlay.update_text("No active sessions", is_final=True)
-                        elif previous_count == 0 and current_count > 0 and self._overlay:
-                            # Sessions became available again
-                            self._overlay.clear()
-                            self._overlay.set_listening(True)
-
-                except Exception as e:
-                    self._logger.debug(f"Session refresh error: {e}")
+                changed.clear()
+                # Force a full rescan once per heartbeat interval, whether or
+                # not a notification arrived: title changes fire constantly,
+                # so waiting for a quiet interval would almost never rescan,
+                # and anything a missed notification hid from the fingerprint
+                # would go uncaught
+                force = time.monotonic() - last_forced >= heartbeat_interval
+                if force:
+                    last_forced = time.monotonic()
+                await self._refresh_sessions(force=force)
 
         except asyncio.CancelledError:
             pass
+        finally:
+            watcher.cancel()
+            try:
+                await watcher
+            except asyncio.CancelledError:
+                pass
+
+    async def _watch_iterm_changes(self, changed: asyncio.Event) -> None:
+        """Set an event whenever iTerm2 reports a session or layout change.
+
+        Args:
+            changed: Event to set on each notification
+        """
+        try:
+            await self._iterm.watch_topology(changed.set)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._logger.warning(
+                f"iTerm2 change notifications unavailable, relying on heartbeat: {e}"
+            )
+
+    async def _refresh_sessions(self, force: bool = False) -> None:
+        """Refresh sessions and update the overlay if the session count changed.
+
+        Args:
+            force: Rescan even if the iTerm2 topology looks unchanged
+        """
+        try:
+            previous_count = self._session_manager.get_session_count()
+            await self._session_manager.refresh_sessions(force=force)
+            current_count = self._session_manager.get_session_count()
+
+            # Log changes in session count
+            if current_count != previous_count:
+                self._logger.info(
+                    "Session count changed: %d -> %d", previous_count, current_count
+                )
+
+                # Update overlay if no sessions
+                if current_count == 0 and self._overlay:
+                    self._overlay.update_text("No active sessions", is_final=True)
+                elif previous_count == 0 and current_count > 0 and self._overlay:
+                    # Sessions became available again
+                    self._overlay.clear()
+                    self._overlay.set_listening(True)
+
+        except Exception as e:
+            self._logger.debug("Session refresh error: %s", e)
 
     def _on_transcript(self, text: str, is_final: bool) -> None:
         """Handle transcription results.
@@ -263,29 +351,50 @@ class TalkToClaudeDaemon:
         if not text.strip():
             return
 
-        # Parse the text for commands
-        result = self._parser.parse(text)
+        # Parse the text for commands and hand it to the action worker, so
+        # actions run one at a time in transcript order
+        self._action_queue.put_nowait(self._parser.parse(text))
 
+    async def _action_worker(self) -> None:
+        """Handle parsed transcripts from the action queue sequentially."""
+        while True:
+            result = await self._action_queue.get()
+            try:
+                await self._dispatch(result)
+            except Exception as e:
+                self._logger.error(f"Error handling transcript action: {e}")
+            finally:
+                self._action_queue.task_done()
+
+    async def _dispatch(self, result: ParseResult) -> None:
+        """Carry out a parsed transcript.
+
+        Args:
+            result: Parsed command or text
+        """
         if result.type == CommandType.WINDOW_COMMAND:
             # Handle window activation command
-            asyncio.create_task(self._handle_window_command(result.position))
+            await self._handle_window_command(result.position)
 
         elif result.type == CommandType.CLEAR_RESTART:
             # Handle clear and restart command
-            asyncio.create_task(self._clear_and_restart())
+            await self._clear_and_restart()
 
         elif result.type == CommandType.END_VOICE:
             # Handle end voice command - submit accumulated text
             if result.text:
-                self._text_buffer += " " + result.text
-            asyncio.create_task(self._submit_text())
+                self._text_chunks.append(result.text)
+            await self._submit_text()
 
         else:
             # Regular text - accumulate (don't inject in real-time for performance)
-            if self._text_buffer:
-                self._text_buffer += " " + result.text
-            else:
-                self._text_buffer = result.text
+            if result.text:
+                self._text_chunks.append(result.text)
+
+            # Bound the buffer: submit early if the end phrase never comes
+            if sum(map(len, self._text_chunks)) > self._max_buffer_chars:
+                self._logger.info("Text buffer limit reached, submitting early")
+                await self._submit_text()
 
     async def _handle_window_command(self, position) -> None:
         """Handle window activation command.
@@ -293,7 +402,7 @@ class TalkToClaudeDaemon:
         Args:
             position: Target window position
         """
-        self._logger.info(f"Activating window at position: {position}")
+        self._logger.info("Activating window at position: %s", position)
 
         try:
             session = await self._session_manager.get_session_for_position(position)
@@ -326,7 +435,7 @@ class TalkToClaudeDaemon:
         self._logger.info("Clearing input and restarting...")
 
         # Clear the text buffer
-        self._text_buffer = ""
+        self._text_chunks.clear()
 
         # Clear the current line in the terminal (send Ctrl+U to clear line)
         try:
@@ -341,30 +450,33 @@ class TalkToClaudeDaemon:
 
     async def _submit_text(self) -> None:
         """Submit the accumulated text buffer."""
-        if not self._text_buffer.strip():
+        text = " ".join(self._text_chunks).strip() if self._text_chunks else ""
+        if not text:
             self._logger.debug("No text to submit")
+            self._text_chunks.clear()
             return
 
-        self._logger.info(f"Submitting text: {self._text_buffer}")
+        self._logger.info("Submitting text: %s", text)
 
         try:
-            # Clear the current line first (in case of partial text)
-            # Then send the complete text with newline
-            success = await self._session_manager.submit_to_active(self._text_buffer.strip())
+            # Resolve the target once for this utterance, then send the
+            # complete text with newline
+            session = await self._session_manager.get_active_session()
+            success = await self._session_manager.submit_to_active(text, session=session)
             if success:
                 if self._overlay:
                     self._overlay.update_text("Submitted!", is_final=True)
                     await asyncio.sleep(1)
 
-                    # Refresh sessions to check if there are still active Claude sessions
-                    await self._session_manager.refresh_sessions()
+                    # Rescan to check if there are still active Claude sessions
+                    await self._session_manager.refresh_sessions(force=True)
                     session_count = self._session_manager.get_session_count()
 
                     if session_count > 0:
                         # Still have active sessions - continue listening
                         self._overlay.clear()
                         self._overlay.set_listening(True)
-                        self._logger.debug(f"Still have {session_count} active Claude session(s)")
+                        self._logger.debug("Still have %d active Claude session(s)", session_count)
                     else:
                         # No more sessions - show message but keep listening
                         # (user might open new Claude sessions)
@@ -378,7 +490,7 @@ class TalkToClaudeDaemon:
         except Exception as e:
             self._logger.error(f"Error submitting text: {e}")
         finally:
-            self._text_buffer = ""
+            self._text_chunks.clear()
 
     async def stop(self) -> None:
         """Stop the daemon and cleanup."""
@@ -389,35 +501,52 @@ class TalkToClaudeDaemon:
         if self._audio:
             self._audio.stop()
 
+        # The transcriber and iTerm2 connections are independent, so shut
+        # them down concurrently (worst case is the longest timeout)
+        shutdowns = []
         if self._transcriber:
-            try:
-                await asyncio.wait_for(self._transcriber.stop_streaming(), timeout=3.0)
-            except asyncio.TimeoutError:
-                self._logger.warning("Transcriber stop timed out")
+            shutdowns.append(self._stop_with_timeout(
+                self._transcriber.stop_streaming(), 3.0, "Transcriber stop timed out"
+            ))
+        if self._iterm:
+            shutdowns.append(self._stop_with_timeout(
+                self._iterm.disconnect(), 2.0, "iTerm disconnect timed out"
+            ))
+        await asyncio.gather(*shutdowns)
 
         if self._overlay:
             self._overlay.stop()
 
-        if self._iterm:
-            try:
-                await asyncio.wait_for(self._iterm.disconnect(), timeout=2.0)
-            except asyncio.TimeoutError:
-                self._logger.warning("iTerm disconnect timed out")
-
         # Remove PID file
         self._remove_pid_file()
 
         self._logger.info("Daemon stopped")
 
+    async def _stop_with_timeout(self, coro, timeout: float, message: str) -> None:
+        """Await a shutdown step, logging instead of raising on timeout.
 
-def get_pid() -> Optional[int]:
+        Args:
+            coro: Shutdown coroutine to await
+            timeout: Maximum time to wait in seconds
+            message: Warning to log if the step times out
+        """
+        try:
+            await asyncio.wait_for(coro, timeout=timeout)
+        except asyncio.TimeoutError:
+            self._logger.warning(message)
+
+
+def get_pid(pid_file: Optional[Path] = None) -> Optional[int]:
     """Get the running daemon PID.
 
+    Args:
+        pid_file: PID file path; read from the configuration if omitted
+
     Returns:
         PID if daemon is running, None otherwise
     """
-    config = Config()
-    pid_file = Path(config.daemon["pid_file"])
+    if pid_file is None:
+        pid_file = Path(Config().daemon["pid_file"])
 
     if not pid_file.exists():
         return None
@@ -433,8 +562,11 @@ def get_pid() -> Optional[int]:
 
 def start_daemon() -> None:
     """Start the daemon."""
+    # Initialize configuration
+    config = Config()
+
     # Check if already running
-    pid = get_pid()
+    pid = get_pid(Path(config.daemon["pid_file"]))
     if pid:
         print(f"Daemon already running with PID {pid}")
         sys.exit(1)
@@ -442,8 +574,6 @@ def start_daemon() -> None:
     # Clean up any orphaned processes from previous runs
     _cleanup_orphaned_processes()
 
-    # Initialize configuration
-    config = Config()
     config.ensure_directories()
 
     # Set up logging
@@ -457,6 +587,7 @@ def start_daemon() -> None:
 
     # Create and run daemon
     daemon = TalkToClaudeDaemon(config)
+    _install_event_loop_policy()
 
     try:
         asyncio.run(daemon.start())
@@ -467,51 +598,96 @@ def start_daemon() -> None:
         sys.exit(1)
 
 
+def _install_event_loop_policy() -> None:
+    """Use uvloop for the daemon's event loop when it is installed.
+
+    uvloop is optional (pip install "talk-to-claude[fast]"); without it the
+    default asyncio loop is used.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    get_logger("daemon").debug("Using uvloop event loop")
+
+
 def _cleanup_orphaned_processes() -> None:
     """Clean up any orphaned overlay subprocesses from previous runs.
 
-    Finds Python processes spawned for multiprocessing that have PPID=1
-    (orphaned, parent died) and are running our overlay code.
+    Finds overlay processes that have PPID=1 (orphaned, parent died).
     """
-    import subprocess
+    import psutil
 
     try:
-        # Find orphaned multiprocessing spawn processes (PPID=1)
-        result = subprocess.run(
-            ["pgrep", "-f", "multiprocessing.spawn"],
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode != 0:
-            return  # No matches
-
-        pids = result.stdout.strip().split('\n')
-        for pid in pids:
-            if not pid:
+        # Find orphaned overlay processes (PPID=1) in one pass over the
+        # process table
+        for proc in psutil.process_iter(["pid", "ppid", "cmdline"]):
+            info = proc.info
+            if info["ppid"] != 1:
                 continue
 
-            # Check if this process has PPID=1 (orphaned)
-            ps_result = subprocess.run(
-                ["ps", "-o", "ppid=", "-p", pid],
-                capture_output=True,
-                text=True
-            )
+            cmdline = " ".join(info["cmdline"] or ())
+            if CHILD_MODULE not in cmdline:
+                continue
 
-            if ps_result.returncode == 0:
-                ppid = ps_result.stdout.strip()
-                if ppid == "1":
-                    # This is an orphaned process - kill it
-                    try:
-                        os.kill(int(pid), signal.SIGTERM)
-                        print(f"Cleaned up orphaned overlay process (PID {pid})")
-                    except (ProcessLookupError, PermissionError):
-                        pass
+            # This is an orphaned process - kill it
+            pid = info["pid"]
+            try:
+                os.kill(pid, signal.SIGTERM)
+                print(f"Cleaned up orphaned overlay process (PID {pid})")
+            except (ProcessLookupError, PermissionError):
+                pass
 
     except Exception:
         pass  # Non-critical - continue even if cleanup fails
 
 
+def _wait_for_exit(pid: int, timeout: float) -> bool:
+    """Wait for a process to exit.
+
+    Uses a kqueue process-exit filter where available (macOS) so the wait
+    ends as soon as the process dies, and falls back to polling otherwise.
+
+    Args:
+        pid: Process to wait for
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if the process exited within the timeout
+    """
+    if hasattr(select, "kqueue"):
+        kq = select.kqueue()
+        try:
+            event = select.kevent(
+                pid,
+                filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                fflags=select.KQ_NOTE_EXIT,
+            )
+            if kq.control([event], 1, timeout):
+                return True
+        except ProcessLookupError:
+            return True  # Already gone before the filter was registered
+        finally:
+            kq.close()
+    else:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.1)
+            try:
+                os.kill(pid, 0)  # Check if still running
+            except ProcessLookupError:
+                return True
+
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    return False
+
+
 def stop_daemon() -> None:
     """Stop the running daemon."""
     pid = get_pid()
@@ -525,22 +701,13 @@ def stop_daemon() -> None:
     try:
         os.kill(pid, signal.SIGTERM)
 
-        # Wait for graceful shutdown
-        import time
-        for _ in range(20):  # Wait up to 2 seconds
-            time.sleep(0.1)
+        # Wait up to 2 seconds for graceful shutdown, then force kill
+        if not _wait_for_exit(pid, timeout=2.0):
             try:
-                os.kill(pid, 0)  # Check if still running
+                print("Daemon didn't stop gracefully, force killing...")
+                os.kill(pid, signal.SIGKILL)
             except ProcessLookupError:
-                break
-
-        # Force kill if still running
-        try:
-            os.kill(pid, 0)
-            print("Daemon didn't stop gracefully, force killing...")
-            os.kill(pid, signal.SIGKILL)
-        except ProcessLookupError:
-            pass
+                pass
 
         print("Daemon stopped")
 
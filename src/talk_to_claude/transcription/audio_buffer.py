@@ -0,0 +1,141 @@
+"""Coalescing buffer for streaming audio to transcription services."""
+
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+from ..utils.logger import get_logger
+
+
+class AudioSendBuffer:
+    """Coalesces small audio chunks into larger WebSocket sends.
+
+    Chunks are queued without blocking and a single sender task appends them
+    to a buffer that is sent once it reaches the target size, so a stalled
+    connection never holds up the caller. When the queue is full the oldest
+    chunk is dropped. The sender also sends a partially filled buffer once
+    it has waited one flush interval, so audio still goes out promptly when
+    chunks arrive slowly. Only the sender task calls the send function, so
+    sends never overlap.
+    """
+
+    # Longest stop() waits for the sender to finish its last send (seconds)
+    STOP_TIMEOUT = 2.0
+
+    def __init__(
+        self,
+        send: Callable[[bytes], Awaitable[None]],
+        target_bytes: int = 3200,
+        flush_interval_ms: int = 50,
+        max_queued: int = 64,
+    ):
+        """Initialize the send buffer.
+
+        Args:
+            send: Coroutine function that transmits one coalesced payload
+            target_bytes: Buffered size that triggers an immediate send
+                (3200 bytes is 100 ms of 16 kHz mono 16-bit PCM)
+            flush_interval_ms: Longest a partially filled buffer waits
+                before it is sent
+            max_queued: Chunks held while the sender is busy before the
+                oldest are dropped
+        """
+        self._send = send
+        self.target_bytes = max(1, target_bytes)
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.max_queued = max(1, max_queued)
+
+        self._buffer = bytearray()
+        # Unbounded so the end marker always fits; add() enforces max_queued
+        self._queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+        self._sender_task: Optional[asyncio.Task] = None
+        self._logger = get_logger("transcription.audio_buffer")
+
+    def start(self) -> None:
+        """Start the sender task."""
+        if self._sender_task is None:
+            self._sender_task = asyncio.create_task(self._sender_loop())
+
+    async def add(self, audio_chunk: bytes | bytearray | memoryview) -> None:
+        """Queue an audio chunk for sending.
+
+        Never waits on the connection. The chunk is copied unless it is
+        already immutable bytes, so the caller's memory can be reused as soon
+        as this returns.
+
+        Args:
+            audio_chunk: Raw audio data in any bytes-like object
+        """
+        if self._queue.qsize() >= self.max_queued:
+            self._queue.get_nowait()
+            self._logger.warning("Audio send queue full, dropping oldest chunk")
+        self._queue.put_nowait(bytes(audio_chunk))
+
+    async def stop(self) -> None:
+        """Stop the sender once it has sent all queued and buffered audio.
+
+        The sender is asked to finish rather than cancelled, so a send in
+        progress completes; it is only cancelled if it outlasts
+        STOP_TIMEOUT.
+        """
+        task = self._sender_task
+        self._sender_task = None
+        if task is None:
+            return
+
+        self._queue.put_nowait(None)
+        try:
+            await asyncio.wait_for(task, timeout=self.STOP_TIMEOUT)
+        except asyncio.TimeoutError:
+            self._logger.warning("Timed out sending remaining audio")
+        except asyncio.CancelledError:
+            pass
+
+    async def _flush(self) -> None:
+        """Send everything currently buffered."""
+        if not self._buffer:
+            return
+
+        payload = bytes(self._buffer)
+        self._buffer.clear()
+        try:
+            await self._send(payload)
+        except Exception as e:
+            self._logger.error(f"Error sending audio buffer: {e}")
+
+    async def _sender_loop(self) -> None:
+        """Move queued chunks into the buffer and send it until the end marker."""
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        # When the buffered audio must go out even if the buffer isn't full
+        deadline = None
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                chunk = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                await self._flush()
+                deadline = None
+                continue
+
+            # Take everything already waiting before deciding to send
+            while chunk is not None:
+                if not self._buffer:
+                    deadline = loop.time() + self.flush_interval
+                self._buffer.extend(chunk)
+                if queue.empty() or len(self._buffer) >= self.target_bytes:
+                    break
+                chunk = queue.get_nowait()
+
+            if chunk is None:
+                # End marker: send whatever is left and finish
+                while not queue.empty():
+                    chunk = queue.get_nowait()
+                    if chunk is not None:
+                        self._buffer.extend(chunk)
+                await self._flush()
+                return
+
+            if len(self._buffer) >= self.target_bytes:
+                await self._flush()
+                deadline = None
@@ -44,11 +44,16 @@ class BaseTranscriber(ABC):
         ...
 
     @abstractmethod
-    async def send_audio(self, audio_chunk: bytes) -> None:
+    async def send_audio(self, audio_chunk: bytes | bytearray | memoryview) -> None:
         """Send audio chunk to the transcription service.
 
+        Implementations queue the chunk rather than waiting on the network,
+        so the capture loop is never held up by a slow connection.
+
         Args:
             audio_chunk: Raw audio data (typically 16-bit PCM, 16kHz, mono)
+                in any bytes-like object; it is not retained after the call
+                returns, so callers may reuse the underlying buffer
         """
         ...
 
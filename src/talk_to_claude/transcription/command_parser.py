@@ -1,13 +1,66 @@
 """Command parser for voice commands."""
 
+import functools
 import re
 from dataclasses import dataclass
 from enum import Enum, auto
+from types import MappingProxyType
 from typing import Optional
 
 from ..utils.logger import get_logger
 
 
+def _trie_pattern(node: dict) -> str:
+    """Render a character trie as a regex body.
+
+    Args:
+        node: Trie node mapping characters to child nodes; the "" key marks
+            the end of a phrase
+
+    Returns:
+        Regex matching every phrase below the node
+    """
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    if "" in node:
+        # A phrase ends here; the greedy optional group still prefers the
+        # longer phrases that continue past it
+        return "(?:" + "|".join(branches) + ")?"
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+def _compile_phrases(phrases: list[str]) -> re.Pattern:
+    """Compile literal phrases into a single trie-shaped alternation.
+
+    Phrases sharing a prefix share one branch of the pattern, so the regex
+    engine tests each input position against the common prefix once
+    instead of once per phrase, and prefers the longest phrase at a position.
+
+    Args:
+        phrases: Phrases to match literally
+
+    Returns:
+        Compiled pattern matching any of the phrases
+    """
+    if not phrases:
+        return re.compile(r"(?!)")  # Never matches
+
+    trie: dict = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return re.compile(_trie_pattern(trie), re.IGNORECASE)
+
+
+# Start of a (possibly partial) command, ignoring case and leading whitespace
+_COMMAND_PREFIX_RE = re.compile(r"\s*(?:activate|go to|switch to|end)", re.IGNORECASE)
+
+
 class CommandType(Enum):
     """Types of parsed commands."""
 
@@ -33,7 +86,7 @@ class VerticalPosition(Enum):
     LOWER = "lower"
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowPosition:
     """Position of a window/pane in the split layout."""
 
@@ -44,7 +97,7 @@ class WindowPosition:
         return f"{self.vertical.value}-{self.horizontal.value}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """Result of parsing a voice command."""
 
@@ -57,27 +110,43 @@ class CommandParser:
     """Parses voice input to identify commands vs regular text."""
 
     # Position word mappings
-    HORIZONTAL_WORDS = {
+    # Read-only views, since the tables are shared by every parser
+    HORIZONTAL_WORDS = MappingProxyType({
         "left": HorizontalPosition.LEFT,
         "right": HorizontalPosition.RIGHT,
         "center": HorizontalPosition.CENTER,
         "middle": HorizontalPosition.CENTER,
-    }
+    })
 
-    VERTICAL_WORDS = {
+    VERTICAL_WORDS = MappingProxyType({
         "upper": VerticalPosition.UPPER,
         "top": VerticalPosition.UPPER,
         "lower": VerticalPosition.LOWER,
         "bottom": VerticalPosition.LOWER,
         "middle": VerticalPosition.MIDDLE,
         "center": VerticalPosition.MIDDLE,
-    }
+    })
+
+    # Merged word -> (is_vertical, position) table; horizontal bindings are
+    # added last so ambiguous words ("middle", "center") stay horizontal
+    _POSITION_WORDS = MappingProxyType({
+        **{word: (True, pos) for word, pos in VERTICAL_WORDS.items()},
+        **{word: (False, pos) for word, pos in HORIZONTAL_WORDS.items()},
+    })
 
     # Window command patterns
     WINDOW_PATTERNS = [
         r"(?:activate|go to|switch to)\s+(?:the\s+)?(.+?)\s*(?:window|pane)?$",
     ]
 
+    # Words that open a window command
+    _WINDOW_PREFIXES = ("activate", "go to", "switch to")
+
+    # All window patterns merged into one regex, compiled once at class
+    # creation and shared by all parsers. Each pattern captures the position
+    # text in exactly one group.
+    _WINDOW_RE = re.compile("|".join(WINDOW_PATTERNS), re.IGNORECASE)
+
     def __init__(
         self,
         end_voice_phrase: str = "end voice",
@@ -99,7 +168,47 @@ class CommandParser:
         self.clear_restart_phrases = [p.lower() for p in self.clear_restart_phrases]
 
         self._logger = get_logger("transcription.parser")
-        self._compiled_patterns = [re.compile(p, re.IGNORECASE) for p in self.WINDOW_PATTERNS]
+
+        # One alternation per phrase list detects a command in a single scan;
+        # per-phrase patterns then pick the end phrase by list priority
+        self._clear_restart_re = _compile_phrases(self.clear_restart_phrases)
+        self._end_voice_re = _compile_phrases(self.end_voice_phrases)
+        self._end_voice_patterns = [
+            re.compile(re.escape(p), re.IGNORECASE) for p in self.end_voice_phrases
+        ]
+
+        # Shortest text that could hold any command; anything shorter is
+        # plain text without running a regex
+        self._min_command_len = min(
+            len(p)
+            for p in (*self.end_voice_phrases, *self.clear_restart_phrases, *self._WINDOW_PREFIXES)
+        )
+
+    @classmethod
+    def get(
+        cls,
+        end_voice_phrase: str = "end voice",
+        additional_end_phrases: list[str] | None = None,
+        clear_restart_phrases: list[str] | None = None,
+    ) -> "CommandParser":
+        """Get a shared parser for a configuration.
+
+        Parsers are not modified after construction, so one instance per
+        phrase configuration is reused and its patterns compiled only once.
+
+        Args:
+            end_voice_phrase: Primary phrase to end voice input
+            additional_end_phrases: Additional phrases that end voice input
+            clear_restart_phrases: Phrases that clear input and restart listening
+
+        Returns:
+            CommandParser for the configuration
+        """
+        return _build_parser(
+            end_voice_phrase,
+            tuple(additional_end_phrases) if additional_end_phrases else None,
+            tuple(clear_restart_phrases) if clear_restart_phrases else None,
+        )
 
     def parse(self, text: str) -> ParseResult:
         """Parse transcribed text for commands.
@@ -111,30 +220,32 @@ class CommandParser:
             ParseResult with command type and relevant data
         """
         text = text.strip()
-        text_lower = text.lower()
+
+        if len(text) < self._min_command_len:
+            return ParseResult(type=CommandType.TEXT, text=text)
 
         # Check for clear and restart command first
-        for phrase in self.clear_restart_phrases:
-            if phrase in text_lower:
-                self._logger.debug(f"Detected clear/restart command: {text}")
-                return ParseResult(type=CommandType.CLEAR_RESTART)
+        if self._clear_restart_re.search(text):
+            self._logger.debug("Detected clear/restart command: %s", text)
+            return ParseResult(type=CommandType.CLEAR_RESTART)
 
         # Check for end voice command
-        for phrase in self.end_voice_phrases:
-            if phrase in text_lower:
-                self._logger.debug(f"Detected end voice command: {text}")
-                # Extract any text before the end phrase
-                idx = text_lower.find(phrase)
-                prefix_text = text[:idx].strip()
-                return ParseResult(
-                    type=CommandType.END_VOICE,
-                    text=prefix_text if prefix_text else None,
-                )
+        if self._end_voice_re.search(text):
+            self._logger.debug("Detected end voice command: %s", text)
+            # Extract any text before the highest-priority end phrase present
+            for pattern in self._end_voice_patterns:
+                match = pattern.search(text)
+                if match:
+                    prefix_text = text[:match.start()].strip()
+                    return ParseResult(
+                        type=CommandType.END_VOICE,
+                        text=prefix_text if prefix_text else None,
+                    )
 
         # Check for window activation command
         position = self._parse_window_command(text)
         if position:
-            self._logger.debug(f"Detected window command: {position}")
+            self._logger.debug("Detected window command: %s", position)
             return ParseResult(type=CommandType.WINDOW_COMMAND, position=position)
 
         # Default: regular text
@@ -149,13 +260,13 @@ class CommandParser:
         Returns:
             WindowPosition if command found, None otherwise
         """
-        for pattern in self._compiled_patterns:
-            match = pattern.search(text)
-            if match:
-                position_text = match.group(1).lower()
-                return self._parse_position(position_text)
+        match = self._WINDOW_RE.search(text)
+        if not match:
+            return None
 
-        return None
+        # The matching pattern's group is the last (only) one that matched
+        position_text = match.group(match.lastindex).lower()
+        return self._parse_position(position_text)
 
     def _parse_position(self, position_text: str) -> WindowPosition | None:
         """Parse position text into WindowPosition.
@@ -166,17 +277,22 @@ class CommandParser:
         Returns:
             WindowPosition if valid, None otherwise
         """
-        words = position_text.split()
+        position_words = self._POSITION_WORDS
 
         horizontal: HorizontalPosition | None = None
         vertical: VerticalPosition | None = None
-
-        for word in words:
-            word = word.strip()
-            if word in self.HORIZONTAL_WORDS:
-                horizontal = self.HORIZONTAL_WORDS[word]
-            elif word in self.VERTICAL_WORDS:
-                vertical = self.VERTICAL_WORDS[word]
+        found = False
+
+        for word in position_text.split():
+            entry = position_words.get(word)
+            if entry is None:
+                continue
+            found = True
+            is_vertical, pos = entry
+            if is_vertical:
+                vertical = pos
+            else:
+                horizontal = pos
 
         # Default values if not specified
         if horizontal is None:
@@ -185,7 +301,7 @@ class CommandParser:
             vertical = VerticalPosition.MIDDLE
 
         # Only return if at least one position was specified
-        if any(w in self.HORIZONTAL_WORDS or w in self.VERTICAL_WORDS for w in words):
+        if found:
             return WindowPosition(horizontal=horizontal, vertical=vertical)
 
         return None
@@ -201,6 +317,18 @@ class CommandParser:
         Returns:
             True if text appears to be starting a command
         """
-        text_lower = text.lower().strip()
-        command_prefixes = ["activate", "go to", "switch to", "end"]
-        return any(text_lower.startswith(prefix) for prefix in command_prefixes)
+        return _COMMAND_PREFIX_RE.match(text) is not None
+
+
+@functools.lru_cache(maxsize=32)
+def _build_parser(
+    end_voice_phrase: str,
+    additional_end_phrases: tuple[str, ...] | None,
+    clear_restart_phrases: tuple[str, ...] | None,
+) -> CommandParser:
+    """Build a parser, cached per (hashable) configuration."""
+    return CommandParser(
+        end_voice_phrase,
+        list(additional_end_phrases) if additional_end_phrases else None,
+        list(clear_restart_phrases) if clear_restart_phrases else None,
+    )
@@ -1,6 +1,7 @@
 """Deepgram real-time transcription client."""
 
 import asyncio
+import logging
 from typing import Callable
 
 from deepgram import (
@@ -10,6 +11,7 @@ from deepgram import (
     LiveOptions,
 )
 
+from .audio_buffer import AudioSendBuffer
 from .base import BaseTranscriber
 from ..utils.logger import get_logger
 
@@ -25,6 +27,7 @@ class DeepgramTranscriber(BaseTranscriber):
         interim_results: bool = True,
         smart_format: bool = True,
         utterance_end_ms: int = 1000,
+        send_buffer_bytes: int = 3200,
     ):
         """Initialize Deepgram transcriber.
 
@@ -35,6 +38,7 @@ class DeepgramTranscriber(BaseTranscriber):
             interim_results: Whether to receive interim (partial) results
             smart_format: Enable smart formatting (punctuation, etc.)
             utterance_end_ms: Milliseconds of silence to detect utterance end
+            send_buffer_bytes: Audio buffered before each WebSocket send
         """
         self.api_key = api_key
         self.model = model
@@ -42,13 +46,16 @@ class DeepgramTranscriber(BaseTranscriber):
         self.interim_results = interim_results
         self.smart_format = smart_format
         self.utterance_end_ms = utterance_end_ms
+        self.send_buffer_bytes = send_buffer_bytes
 
         self._client: DeepgramClient | None = None
         self._connection = None
+        self._send_buffer: AudioSendBuffer | None = None
         self._transcript_callback: Callable[[str, bool], None] | None = None
         self._utterance_end_callback: Callable[[], None] | None = None
         self._logger = get_logger("transcription.deepgram")
         self._connected = False
+        self._loop: asyncio.AbstractEventLoop | None = None
 
     def on_transcript(self, callback: Callable[[str, bool], None]) -> None:
         """Register callback for transcription results.
@@ -73,6 +80,10 @@ class DeepgramTranscriber(BaseTranscriber):
             return
 
         try:
+            # Callbacks are dispatched onto this loop so event handlers return
+            # to the receiver immediately
+            self._loop = asyncio.get_running_loop()
+
             # Create Deepgram client
             config = DeepgramClientOptions(options={"keepalive": "true"})
             self._client = DeepgramClient(self.api_key, config)
@@ -102,6 +113,8 @@ class DeepgramTranscriber(BaseTranscriber):
             # Start the connection
             if await self._connection.start(options):
                 self._connected = True
+                self._send_buffer = AudioSendBuffer(self._send_payload, self.send_buffer_bytes)
+                self._send_buffer.start()
                 self._logger.info("Connected to Deepgram streaming API")
             else:
                 raise ConnectionError("Failed to connect to Deepgram")
@@ -123,11 +136,13 @@ class DeepgramTranscriber(BaseTranscriber):
 
             is_final = result.is_final
             if self._transcript_callback:
-                self._transcript_callback(sentence, is_final)
+                self._loop.call_soon_threadsafe(self._transcript_callback, sentence, is_final)
 
-            self._logger.debug(
-                f"Transcript ({'final' if is_final else 'interim'}): {sentence}"
-            )
+            # Guarded so interim-rate events skip the logging call entirely
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "Transcript (%s): %s", "final" if is_final else "interim", sentence
+                )
         except Exception as e:
             self._logger.error(f"Error processing transcript: {e}")
 
@@ -135,7 +150,7 @@ class DeepgramTranscriber(BaseTranscriber):
         """Handle utterance end event."""
         self._logger.debug("Utterance end detected")
         if self._utterance_end_callback:
-            self._utterance_end_callback()
+            self._loop.call_soon_threadsafe(self._utterance_end_callback)
 
     async def _on_error(self, client, error, **kwargs) -> None:
         """Handle error event."""
@@ -146,27 +161,38 @@ class DeepgramTranscriber(BaseTranscriber):
         self._logger.info("Deepgram connection closed")
         self._connected = False
 
-    async def send_audio(self, audio_chunk: bytes) -> None:
+    async def send_audio(self, audio_chunk: bytes | bytearray | memoryview) -> None:
         """Send audio chunk to Deepgram for transcription.
 
         Args:
             audio_chunk: Raw audio data (16-bit PCM, 16kHz, mono)
         """
-        if not self._connected or not self._connection:
+        if not self._connected or not self._connection or not self._send_buffer:
             self._logger.warning("Not connected to Deepgram, cannot send audio")
             return
 
+        await self._send_buffer.add(audio_chunk)
+
+    async def _send_payload(self, payload: bytes) -> None:
+        """Send a coalesced audio payload over the WebSocket.
+
+        Args:
+            payload: Buffered audio data
+        """
+        if not self._connection:
+            return
+
         try:
-            await self._connection.send(audio_chunk)
+            await self._connection.send(payload)
         except Exception as e:
             self._logger.error(f"Error sending audio to Deepgram: {e}")
 
     async def stop_streaming(self) -> None:
         """Close WebSocket connection."""
-        if not self._connected:
-            return
-
         try:
+            if self._send_buffer:
+                await self._send_buffer.stop()
+                self._send_buffer = None
             if self._connection:
                 await asyncio.wait_for(self._connection.finish(), timeout=2.0)
             self._logger.info("Deepgram streaming stopped")
@@ -178,6 +204,7 @@ class DeepgramTranscriber(BaseTranscriber):
             self._connected = False
             self._connection = None
             self._client = None
+            self._send_buffer = None
 
     @property
     def is_connected(self) -> bool:
@@ -1,12 +1,14 @@
 """ElevenLabs real-time transcription client."""
 
 import asyncio
-import json
-from typing import Callable, Optional
+import logging
+from typing import Callable, Dict, Optional
 
+import orjson
 import websockets
-from websockets.client import WebSocketClientProtocol
+from websockets.asyncio.client import ClientConnection
 
+from .audio_buffer import AudioSendBuffer
 from .base import BaseTranscriber
 from ..utils.logger import get_logger
 
@@ -27,6 +29,7 @@ class ElevenLabsTranscriber(BaseTranscriber):
         model: str = "scribe_v1",
         language_code: str = "en",
         sample_rate: int = 16000,
+        send_buffer_bytes: int = 3200,
     ):
         """Initialize ElevenLabs transcriber.
 
@@ -35,21 +38,44 @@ class ElevenLabsTranscriber(BaseTranscriber):
             model: Model to use (scribe_v1 is the primary STT model)
             language_code: Language code (e.g., 'en', 'es', 'fr')
             sample_rate: Audio sample rate in Hz
+            send_buffer_bytes: Audio buffered before each WebSocket send
         """
         self.api_key = api_key
         self.model = model
         self.language_code = language_code
         self.sample_rate = sample_rate
-
-        self._websocket: Optional[WebSocketClientProtocol] = None
+        self.send_buffer_bytes = send_buffer_bytes
+
+        # WebSocket URL with query parameters and API key header; these never
+        # change for an instance, so build them once for every (re)connect
+        self._ws_url = (
+            f"{self.WEBSOCKET_URL}"
+            f"?model_id={self.model}"
+            f"&language_code={self.language_code}"
+            f"&sample_rate={self.sample_rate}"
+            f"&encoding=pcm_s16le"
+        )
+        self._headers = {"xi-api-key": self.api_key}
+
+        self._websocket: Optional[ClientConnection] = None
+        self._send_buffer: Optional[AudioSendBuffer] = None
         self._transcript_callback: Optional[Callable[[str, bool], None]] = None
         self._utterance_end_callback: Optional[Callable[[], None]] = None
         self._logger = get_logger("transcription.elevenlabs")
         self._connected = False
         self._receive_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._accumulated_text = ""
         self._last_final_text = ""
 
+        # Message handlers keyed by message type
+        self._handlers: Dict[str, Callable[[dict], None]] = {
+            "transcript": self._handle_transcript,
+            "utterance_end": self._handle_utterance_end,
+            "error": self._handle_error,
+            "connected": self._handle_connected,
+        }
+
     def on_transcript(self, callback: Callable[[str, bool], None]) -> None:
         """Register callback for transcription results.
 
@@ -73,28 +99,25 @@ class ElevenLabsTranscriber(BaseTranscriber):
             return
 
         try:
-            # Build WebSocket URL with query parameters
-            url = (
-                f"{self.WEBSOCKET_URL}"
-                f"?model_id={self.model}"
-                f"&language_code={self.language_code}"
-                f"&sample_rate={self.sample_rate}"
-                f"&encoding=pcm_s16le"
-            )
-
-            # Connect with API key in header
-            headers = {
-                "xi-api-key": self.api_key,
-            }
+            # Callbacks are dispatched onto this loop so message handling
+            # returns to the receiver immediately
+            self._loop = asyncio.get_running_loop()
 
+            # Audio goes out as uncompressed frames to keep per-frame zlib
+            # work off the send path; a larger write buffer lets bursty
+            # audio sends return before the transport has drained
             self._websocket = await websockets.connect(
-                url,
-                additional_headers=headers,
+                self._ws_url,
+                additional_headers=self._headers,
                 ping_interval=20,
                 ping_timeout=10,
+                compression=None,
+                write_limit=2**20,
             )
 
             self._connected = True
+            self._send_buffer = AudioSendBuffer(self._send_payload, self.send_buffer_bytes)
+            self._send_buffer.start()
             self._logger.info("Connected to ElevenLabs streaming API")
 
             # Start receiving messages in background
@@ -107,7 +130,10 @@ class ElevenLabsTranscriber(BaseTranscriber):
     async def _receive_messages(self) -> None:
         """Receive and process messages from WebSocket."""
         try:
-            async for message in self._websocket:
+            while True:
+                # Take frames undecoded; orjson parses the UTF-8 bytes
+                # directly, skipping the intermediate str
+                message = await self._websocket.recv(decode=False)
                 await self._handle_message(message)
         except websockets.exceptions.ConnectionClosed as e:
             self._logger.info(f"ElevenLabs connection closed: {e}")
@@ -118,64 +144,99 @@ class ElevenLabsTranscriber(BaseTranscriber):
         finally:
             self._connected = False
 
-    async def _handle_message(self, message: str) -> None:
+    async def _handle_message(self, message: str | bytes) -> None:
         """Handle incoming WebSocket message.
 
         Args:
-            message: JSON message from ElevenLabs
+            message: JSON message from ElevenLabs (text or binary frame)
         """
         try:
-            data = json.loads(message)
-            msg_type = data.get("type", "")
+            # orjson parses str and bytes directly, so binary frames skip
+            # the decode to str
+            data = orjson.loads(message)
+            handler = self._handlers.get(data.get("type", ""))
+            if handler:
+                handler(data)
+
+        except orjson.JSONDecodeError as e:
+            self._logger.error(f"Failed to parse ElevenLabs message: {e}")
+        except Exception as e:
+            self._logger.error(f"Error handling ElevenLabs message: {e}")
 
-            if msg_type == "transcript":
-                # Handle transcription result
-                text = data.get("text", "")
-                is_final = data.get("is_final", False)
+    def _handle_transcript(self, data: dict) -> None:
+        """Handle a transcription result message.
+
+        Args:
+            data: Decoded message
+        """
+        text = data.get("text", "")
+        if not text:
+            return
 
-                if text:
-                    if self._transcript_callback:
-                        self._transcript_callback(text, is_final)
+        is_final = data.get("is_final", False)
+        if self._transcript_callback:
+            self._loop.call_soon_threadsafe(self._transcript_callback, text, is_final)
 
-                    self._logger.debug(
-                        f"Transcript ({'final' if is_final else 'interim'}): {text}"
-                    )
+        # Guarded so interim-rate messages skip the logging call entirely
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                "Transcript (%s): %s", "final" if is_final else "interim", text
+            )
 
-                    if is_final:
-                        self._last_final_text = text
+        if is_final:
+            self._last_final_text = text
 
-            elif msg_type == "utterance_end":
-                # Handle utterance end
-                self._logger.debug("Utterance end detected")
-                if self._utterance_end_callback:
-                    self._utterance_end_callback()
+    def _handle_utterance_end(self, data: dict) -> None:
+        """Handle an utterance end message.
 
-            elif msg_type == "error":
-                # Handle error message
-                error_msg = data.get("message", "Unknown error")
-                self._logger.error(f"ElevenLabs error: {error_msg}")
+        Args:
+            data: Decoded message
+        """
+        self._logger.debug("Utterance end detected")
+        if self._utterance_end_callback:
+            self._loop.call_soon_threadsafe(self._utterance_end_callback)
 
-            elif msg_type == "connected":
-                self._logger.debug("ElevenLabs WebSocket connection confirmed")
+    def _handle_error(self, data: dict) -> None:
+        """Handle an error message.
 
-        except json.JSONDecodeError as e:
-            self._logger.error(f"Failed to parse ElevenLabs message: {e}")
-        except Exception as e:
-            self._logger.error(f"Error handling ElevenLabs message: {e}")
+        Args:
+            data: Decoded message
+        """
+        error_msg = data.get("message", "Unknown error")
+        self._logger.error(f"ElevenLabs error: {error_msg}")
+
+    def _handle_connected(self, data: dict) -> None:
+        """Handle the connection confirmation message.
 
-    async def send_audio(self, audio_chunk: bytes) -> None:
+        Args:
+            data: Decoded message
+        """
+        self._logger.debug("ElevenLabs WebSocket connection confirmed")
+
+    async def send_audio(self, audio_chunk: bytes | bytearray | memoryview) -> None:
         """Send audio chunk to ElevenLabs for transcription.
 
         Args:
             audio_chunk: Raw audio data (16-bit PCM, specified sample rate, mono)
         """
-        if not self._connected or not self._websocket:
+        if not self._connected or not self._websocket or not self._send_buffer:
             self._logger.warning("Not connected to ElevenLabs, cannot send audio")
             return
 
+        await self._send_buffer.add(audio_chunk)
+
+    async def _send_payload(self, payload: bytes) -> None:
+        """Send a coalesced audio payload over the WebSocket.
+
+        Args:
+            payload: Buffered audio data
+        """
+        if not self._connected or not self._websocket:
+            return
+
         try:
             # ElevenLabs expects binary audio data directly
-            await self._websocket.send(audio_chunk)
+            await self._websocket.send(payload)
         except websockets.exceptions.ConnectionClosed:
             self._logger.warning("ElevenLabs connection closed while sending audio")
             self._connected = False
@@ -184,17 +245,18 @@ class ElevenLabsTranscriber(BaseTranscriber):
 
     async def stop_streaming(self) -> None:
         """Close WebSocket connection."""
-        if not self._connected:
-            return
-
         try:
+            # Send any queued and buffered audio, then stop the sender
+            if self._send_buffer:
+                await self._send_buffer.stop()
+                self._send_buffer = None
+
             # Cancel receive task
             if self._receive_task:
                 self._receive_task.cancel()
-                try:
-                    await asyncio.wait_for(self._receive_task, timeout=1.0)
-                except (asyncio.TimeoutError, asyncio.CancelledError):
-                    pass
+                # The task already exists, so wait on it directly rather than
+                # through wait_for (no wrapper, and no re-cancel on timeout)
+                await asyncio.wait({self._receive_task}, timeout=1.0)
                 self._receive_task = None
 
             # Send end of stream signal if supported
@@ -215,6 +277,7 @@ class ElevenLabsTranscriber(BaseTranscriber):
         finally:
             self._connected = False
             self._websocket = None
+            self._send_buffer = None
 
     @property
     def is_connected(self) -> bool:
@@ -1,6 +1,6 @@
 """Factory for creating transcription service providers."""
 
-from typing import Dict, Any, Type
+from typing import Any, Callable, Dict, Type, Union
 
 from .base import BaseTranscriber
 from .deepgram_client import DeepgramTranscriber
@@ -10,11 +10,56 @@ from ..utils.logger import get_logger
 
 _logger = get_logger("transcription.factory")
 
+# Builds a transcriber from the transcription configuration
+ProviderBuilder = Callable[[Dict[str, Any]], BaseTranscriber]
+
+
+def _build_deepgram(config: Dict[str, Any]) -> BaseTranscriber:
+    """Create a Deepgram transcriber from configuration."""
+    provider_config = config.get("deepgram", {})
+    return DeepgramTranscriber(
+        api_key=config["api_key"],
+        model=provider_config.get("model", "nova-2-general"),
+        language=provider_config.get("language", "en-US"),
+        interim_results=config.get("interim_results", True),
+        smart_format=provider_config.get("smart_format", True),
+        utterance_end_ms=provider_config.get("utterance_end_ms", 1000),
+        send_buffer_bytes=config.get("send_buffer_bytes", 3200),
+    )
+
+
+def _build_elevenlabs(config: Dict[str, Any]) -> BaseTranscriber:
+    """Create an ElevenLabs transcriber from configuration."""
+    provider_config = config.get("elevenlabs", {})
+    return ElevenLabsTranscriber(
+        api_key=config["api_key"],
+        model=provider_config.get("model", "scribe_v1"),
+        language_code=provider_config.get("language_code", "en"),
+        sample_rate=config.get("sample_rate", 16000),
+        send_buffer_bytes=config.get("send_buffer_bytes", 3200),
+    )
+
+
+def _build_openai(config: Dict[str, Any]) -> BaseTranscriber:
+    """Create an OpenAI transcriber from configuration."""
+    provider_config = config.get("openai", {})
+    return OpenAITranscriber(
+        api_key=config["api_key"],
+        model=provider_config.get("model", "gpt-4o-transcribe"),
+        language=provider_config.get("language", "en"),
+        sample_rate=config.get("sample_rate", 16000),
+        channels=config.get("channels", 1),
+        silence_duration_ms=provider_config.get("silence_duration_ms", 1000),
+        vad_threshold=provider_config.get("vad_threshold", 0.5),
+        send_buffer_bytes=config.get("send_buffer_bytes", 3200),
+    )
+
+
 # Registry of available transcription providers
-PROVIDERS: Dict[str, Type[BaseTranscriber]] = {
-    "deepgram": DeepgramTranscriber,
-    "elevenlabs": ElevenLabsTranscriber,
-    "openai": OpenAITranscriber,
+PROVIDERS: Dict[str, ProviderBuilder] = {
+    "deepgram": _build_deepgram,
+    "elevenlabs": _build_elevenlabs,
+    "openai": _build_openai,
 }
 
 
@@ -43,49 +88,12 @@ def create_transcriber(service: str, config: Dict[str, Any]) -> BaseTranscriber:
             f"Available services: {available}"
         )
 
-    provider_class = PROVIDERS[service]
     _logger.info(f"Creating transcriber: {service}")
 
-    # Extract common configuration
-    api_key = config.get("api_key")
-    if not api_key:
+    if not config.get("api_key"):
         raise KeyError(f"API key not provided for {service} transcription service")
 
-    # Get provider-specific configuration
-    provider_config = config.get(service, {})
-
-    # Create provider instance based on service type
-    if service == "deepgram":
-        return DeepgramTranscriber(
-            api_key=api_key,
-            model=provider_config.get("model", "nova-2-general"),
-            language=provider_config.get("language", "en-US"),
-            interim_results=config.get("interim_results", True),
-            smart_format=provider_config.get("smart_format", True),
-            utterance_end_ms=provider_config.get("utterance_end_ms", 1000),
-        )
-
-    elif service == "elevenlabs":
-        return ElevenLabsTranscriber(
-            api_key=api_key,
-            model=provider_config.get("model", "scribe_v1"),
-            language_code=provider_config.get("language_code", "en"),
-            sample_rate=config.get("sample_rate", 16000),
-        )
-
-    elif service == "openai":
-        return OpenAITranscriber(
-            api_key=api_key,
-            model=provider_config.get("model", "gpt-4o-transcribe"),
-            language=provider_config.get("language", "en"),
-            sample_rate=config.get("sample_rate", 16000),
-            channels=config.get("channels", 1),
-            silence_duration_ms=provider_config.get("silence_duration_ms", 1000),
-            vad_threshold=provider_config.get("vad_threshold", 0.5),
-        )
-
-    # This shouldn't be reached due to the check above, but kept for safety
-    raise ValueError(f"Unhandled transcription service: {service}")
+    return PROVIDERS[service](config)
 
 
 def get_available_providers() -> list[str]:
@@ -97,18 +105,33 @@ def get_available_providers() -> list[str]:
     return list(PROVIDERS.keys())
 
 
-def register_provider(name: str, provider_class: Type[BaseTranscriber]) -> None:
+def register_provider(
+    name: str, provider: Union[Type[BaseTranscriber], ProviderBuilder]
+) -> None:
     """Register a custom transcription provider.
 
     Args:
         name: Name to register the provider under
-        provider_class: Class that implements BaseTranscriber
+        provider: Builder called with the transcription configuration, or a
+            class that implements BaseTranscriber. A class is constructed with
+            the API key plus its provider section as keyword arguments.
     """
-    if not issubclass(provider_class, BaseTranscriber):
-        raise TypeError(
-            f"Provider class must inherit from BaseTranscriber, "
-            f"got {provider_class.__name__}"
-        )
-
-    PROVIDERS[name.lower()] = provider_class
+    if isinstance(provider, type):
+        if not issubclass(provider, BaseTranscriber):
+            raise TypeError(
+                f"Provider class must inherit from BaseTranscriber, "
+                f"got {provider.__name__}"
+            )
+        provider_class = provider
+        key = name.lower()
+
+        def builder(config: Dict[str, Any]) -> BaseTranscriber:
+            return provider_class(api_key=config["api_key"], **config.get(key, {}))
+
+    elif callable(provider):
+        builder = provider
+    else:
+        raise TypeError(f"Provider must be a class or callable, got {provider!r}")
+
+    PROVIDERS[name.lower()] = builder
     _logger.info(f"Registered transcription provider: {name}")
@@ -2,15 +2,42 @@
 
 import asyncio
 import base64
-import json
-from typing import Callable, Optional
+import logging
+import re
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
 
+import orjson
 import websockets
 from websockets.asyncio.client import ClientConnection
 
+from .audio_buffer import AudioSendBuffer
 from .base import BaseTranscriber
+from .resampler import PolyphaseResampler
 from ..utils.logger import get_logger
 
+# Leading "type" field of a server event; events that put another key first
+# simply fall through to the full decode
+_EVENT_TYPE_RE = re.compile(rb'\s*\{\s*"type"\s*:\s*"([^"]+)"')
+
+# Response events, which a transcription-only session ignores
+_IGNORED_EVENT_TYPES = frozenset({
+    "response.created",
+    "response.done",
+    "response.output_item.added",
+})
+# The same types as raw bytes, for the scan of undecoded frames
+_IGNORED_EVENT_TYPE_BYTES = frozenset(t.encode() for t in _IGNORED_EVENT_TYPES)
+
+
+# Callback run time past which the consumer is holding up the event loop
+SLOW_CALLBACK_SECONDS = 0.01
+
+# Queued callback results beyond which new interim results are dropped;
+# finals and utterance ends are always kept
+MAX_QUEUED_CALLBACKS = 64
+
 
 class OpenAITranscriber(BaseTranscriber):
     """Real-time speech-to-text using OpenAI's Realtime WebSocket API.
@@ -24,6 +51,10 @@ class OpenAITranscriber(BaseTranscriber):
     REALTIME_URL = "wss://api.openai.com/v1/realtime?intent=transcription"
     REQUIRED_SAMPLE_RATE = 24000  # OpenAI Realtime API requires 24kHz
 
+    # input_audio_buffer.append event split around its base64 audio field
+    _AUDIO_EVENT_PREFIX = b'{"type":"input_audio_buffer.append","audio":"'
+    _AUDIO_EVENT_SUFFIX = b'"}'
+
     def __init__(
         self,
         api_key: str,
@@ -33,6 +64,7 @@ class OpenAITranscriber(BaseTranscriber):
         channels: int = 1,
         silence_duration_ms: int = 1000,
         vad_threshold: float = 0.5,
+        send_buffer_bytes: int = 3200,
         **kwargs,  # Accept extra kwargs for compatibility
     ):
         """Initialize OpenAI Realtime transcriber.
@@ -45,6 +77,7 @@ class OpenAITranscriber(BaseTranscriber):
             channels: Number of audio channels
             silence_duration_ms: Duration of silence to detect utterance end
             vad_threshold: Voice activity detection threshold (0.0 to 1.0)
+            send_buffer_bytes: Input audio buffered before each append event
         """
         self.api_key = api_key
         self.model = model
@@ -53,14 +86,62 @@ class OpenAITranscriber(BaseTranscriber):
         self.channels = channels
         self.silence_duration_ms = silence_duration_ms
         self.vad_threshold = vad_threshold
+        self.send_buffer_bytes = send_buffer_bytes
 
         self._websocket: Optional[ClientConnection] = None
+        self._send_buffer: Optional[AudioSendBuffer] = None
+        # Reused append event buffer, see _encode_audio_event
+        self._event_buffer = bytearray()
         self._transcript_callback: Optional[Callable[[str, bool], None]] = None
         self._utterance_end_callback: Optional[Callable[[], None]] = None
         self._logger = get_logger("transcription.openai")
         self._connected = False
         self._receive_task: Optional[asyncio.Task] = None
-        self._current_transcript: str = ""
+        # Deltas of the utterance in progress, joined only when emitted
+        self._transcript_parts: list[str] = []
+        self._interim_handle: Optional[asyncio.Handle] = None
+        # Transcript results waiting for the callback worker
+        self._callback_queue: deque[Optional[tuple[str, bool]]] = deque()
+        self._callback_ready = asyncio.Event()
+        self._callback_task: Optional[asyncio.Task] = None
+
+        # Transcription session setup, serialized once and sent on every
+        # connect. For transcription-only sessions, use
+        # transcription_session.update
+        self._session_config = orjson.dumps({
+            "type": "transcription_session.update",
+            "session": {
+                "input_audio_format": "pcm16",
+                "input_audio_transcription": {
+                    "model": self.model,
+                    "language": self.language,
+                },
+                "turn_detection": {
+                    "type": "server_vad",
+                    "threshold": self.vad_threshold,
+                    "silence_duration_ms": self.silence_duration_ms,
+                },
+            },
+        })
+
+        # Event handlers keyed by event type
+        self._handlers: Dict[str, Callable[[dict], None]] = {
+            "session.created": self._on_session_created,
+            "transcription_session.created": self._on_session_created,
+            "session.updated": self._on_session_updated,
+            "transcription_session.updated": self._on_session_updated,
+            "input_audio_buffer.speech_started": self._on_speech_started,
+            "input_audio_buffer.speech_stopped": self._on_speech_stopped,
+            "conversation.item.input_audio_transcription.delta": self._on_transcript_delta,
+            "conversation.item.input_audio_transcription.completed": self._on_transcript_completed,
+            "error": self._on_error,
+        }
+
+        # Anti-aliased polyphase resampling to the required rate; its filter
+        # state carries across chunks of one stream
+        self._resampler: Optional[PolyphaseResampler] = None
+        if sample_rate != self.REQUIRED_SAMPLE_RATE:
+            self._resampler = PolyphaseResampler(sample_rate, self.REQUIRED_SAMPLE_RATE)
 
     def on_transcript(self, callback: Callable[[str, bool], None]) -> None:
         """Register callback for transcription results.
@@ -84,6 +165,9 @@ class OpenAITranscriber(BaseTranscriber):
             self._logger.warning("Already connected to OpenAI Realtime API")
             return
 
+        if self._resampler:
+            self._resampler.reset()
+
         try:
             # Connect to WebSocket with required headers
             headers = {
@@ -91,34 +175,33 @@ class OpenAITranscriber(BaseTranscriber):
                 "OpenAI-Beta": "realtime=v1",
             }
 
+            # Base64 PCM gains nothing from permessage-deflate, so skip the
+            # per-frame zlib work; a larger write buffer lets bursty audio
+            # sends return before the transport has drained
             self._websocket = await websockets.connect(
                 self.REALTIME_URL,
                 additional_headers=headers,
+                compression=None,
+                max_size=2**20,
+                write_limit=2**20,
+                # Bounded incoming queue: a slow consumer stops reads from the
+                # socket (TCP backpressure) instead of growing memory
+                max_queue=32,
             )
             self._connected = True
             self._logger.info("Connected to OpenAI Realtime API")
 
             # Configure the transcription session
-            # For transcription-only sessions, use transcription_session.update
-            session_config = {
-                "type": "transcription_session.update",
-                "session": {
-                    "input_audio_format": "pcm16",
-                    "input_audio_transcription": {
-                        "model": self.model,
-                        "language": self.language,
-                    },
-                    "turn_detection": {
-                        "type": "server_vad",
-                        "threshold": self.vad_threshold,
-                        "silence_duration_ms": self.silence_duration_ms,
-                    },
-                },
-            }
-            await self._websocket.send(json.dumps(session_config))
-            self._logger.debug(f"Sent session config: {session_config}")
+            await self._websocket.send(self._session_config, text=True)
+            self._logger.debug("Sent session config: %s", self._session_config)
+
+            self._send_buffer = AudioSendBuffer(self._send_payload, self.send_buffer_bytes)
+            self._send_buffer.start()
 
-            # Start receiving messages
+            # Start receiving messages, with callbacks run by their own task
+            self._callback_queue.clear()
+            self._callback_ready = asyncio.Event()
+            self._callback_task = asyncio.create_task(self._callback_worker())
             self._receive_task = asyncio.create_task(self._receive_loop())
 
         except Exception as e:
@@ -129,14 +212,21 @@ class OpenAITranscriber(BaseTranscriber):
     async def _receive_loop(self) -> None:
         """Background task to receive and process WebSocket messages."""
         try:
-            async for message in self._websocket:
-                if not self._connected:
-                    break
+            while self._connected:
+                # A burst of buffered frames is handled back to back; see
+                # _schedule_interim for how its interim callbacks are batched
+                # Take frames undecoded; the type scan and orjson both work
+                # on the UTF-8 bytes, so no intermediate str is built
+                message = await self._websocket.recv(decode=False)
+
+                # Skip events that are ignored anyway without decoding them
+                type_match = _EVENT_TYPE_RE.match(message)
+                if type_match and type_match.group(1) in _IGNORED_EVENT_TYPE_BYTES:
+                    continue
 
                 try:
-                    event = json.loads(message)
-                    await self._handle_event(event)
-                except json.JSONDecodeError as e:
+                    self._handle_event(orjson.loads(message))
+                except orjson.JSONDecodeError as e:
                     self._logger.error(f"Failed to parse message: {e}")
 
         except websockets.exceptions.ConnectionClosed:
@@ -147,63 +237,146 @@ class OpenAITranscriber(BaseTranscriber):
         finally:
             self._connected = False
 
-    async def _handle_event(self, event: dict) -> None:
+    def _handle_event(self, event: dict) -> None:
         """Handle incoming WebSocket events.
 
         Args:
             event: Parsed JSON event from WebSocket
         """
         event_type = event.get("type", "")
+        handler = self._handlers.get(event_type)
+        if handler:
+            handler(event)
+        elif event_type not in _IGNORED_EVENT_TYPES:
+            # Response events are ignored (we're only doing transcription)
+            self._logger.debug("Unhandled event type: %s", event_type)
+
+    def _on_session_created(self, event: dict) -> None:
+        """Handle session creation."""
+        self._logger.debug("Session created")
+
+    def _on_session_updated(self, event: dict) -> None:
+        """Handle session configuration updates."""
+        self._logger.debug("Session updated")
+
+    def _on_speech_started(self, event: dict) -> None:
+        """Handle the start of speech, which begins a new utterance."""
+        self._logger.debug("Speech started")
+        self._cancel_interim()
+        self._transcript_parts.clear()
+
+    def _on_speech_stopped(self, event: dict) -> None:
+        """Handle the end of speech."""
+        self._logger.debug("Speech stopped")
+
+    def _on_transcript_delta(self, event: dict) -> None:
+        """Handle an incremental transcript update."""
+        delta = event.get("delta", "")
+        if delta:
+            self._transcript_parts.append(delta)
+            self._schedule_interim()
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug("Transcript delta: %s", delta)
+
+    def _on_transcript_completed(self, event: dict) -> None:
+        """Handle the final transcript for an utterance."""
+        transcript = event.get("transcript", "")
+        if transcript:
+            # The final text supersedes any interim update still pending
+            self._cancel_interim()
+            self._queue_callback((transcript, True))
+            self._logger.debug("Transcript completed: %s", transcript)
+
+            # Signal utterance end
+            self._queue_callback(None)
+
+            self._transcript_parts.clear()
+
+    def _on_error(self, event: dict) -> None:
+        """Handle an error event."""
+        error = event.get("error", {})
+        self._logger.error(f"OpenAI error: {error.get('message', 'Unknown error')}")
+
+    def _schedule_interim(self) -> None:
+        """Emit the interim transcript once the current burst is handled.
+
+        Deltas that arrive together are received in one pass of the event
+        loop; scheduling the emit instead of calling back per delta joins the
+        parts and updates the display once for the whole burst.
+        """
+        if self._transcript_callback and self._interim_handle is None:
+            self._interim_handle = asyncio.get_running_loop().call_soon(self._emit_interim)
 
-        if event_type in ("session.created", "transcription_session.created"):
-            self._logger.debug("Session created")
-
-        elif event_type in ("session.updated", "transcription_session.updated"):
-            self._logger.debug("Session updated")
-
-        elif event_type == "input_audio_buffer.speech_started":
-            self._logger.debug("Speech started")
-            self._current_transcript = ""
-
-        elif event_type == "input_audio_buffer.speech_stopped":
-            self._logger.debug("Speech stopped")
-
-        elif event_type == "conversation.item.input_audio_transcription.delta":
-            # Incremental transcript update
-            delta = event.get("delta", "")
-            if delta:
-                self._current_transcript += delta
-                if self._transcript_callback:
-                    self._transcript_callback(self._current_transcript, False)
-                self._logger.debug(f"Transcript delta: {delta}")
-
-        elif event_type == "conversation.item.input_audio_transcription.completed":
-            # Final transcript for this utterance
-            transcript = event.get("transcript", "")
-            if transcript:
-                self._current_transcript = transcript
-                if self._transcript_callback:
-                    self._transcript_callback(transcript, True)
-                self._logger.debug(f"Transcript completed: {transcript}")
-
-                # Signal utterance end
-                if self._utterance_end_callback:
-                    self._utterance_end_callback()
+    def _cancel_interim(self) -> None:
+        """Drop a pending interim update."""
+        if self._interim_handle is not None:
+            self._interim_handle.cancel()
+            self._interim_handle = None
 
-                self._current_transcript = ""
+    def _emit_interim(self) -> None:
+        """Send the accumulated interim transcript to the callback."""
+        self._interim_handle = None
+        if self._transcript_parts:
+            self._queue_callback(("".join(self._transcript_parts), False))
 
-        elif event_type == "error":
-            error = event.get("error", {})
-            self._logger.error(f"OpenAI error: {error.get('message', 'Unknown error')}")
+    def _queue_callback(self, item: Optional[tuple[str, bool]]) -> None:
+        """Hand a result to the callback worker without blocking receives.
 
-        elif event_type in ("response.created", "response.done", "response.output_item.added"):
-            # Ignore response events (we're only doing transcription)
-            pass
+        Only interim results are ever discarded: an interim replaces an
+        interim still waiting at the end of the queue, and is dropped if the
+        queue is over MAX_QUEUED_CALLBACKS. Finals and utterance ends are
+        always queued, growing the queue if the callbacks fall behind.
 
-        else:
-            self._logger.debug(f"Unhandled event type: {event_type}")
+        Args:
+            item: (text, is_final) for the transcript callback, or None for
+                the utterance end callback
+        """
+        queue = self._callback_queue
+        if item is not None and not item[1]:
+            last = queue[-1] if queue else None
+            if last is not None and not last[1]:
+                queue[-1] = item
+                return
+            if len(queue) >= MAX_QUEUED_CALLBACKS:
+                self._logger.warning("Transcript callback queue full, dropping interim result")
+                return
+        queue.append(item)
+        self._callback_ready.set()
+
+    def _run_callback(self, item: Optional[tuple[str, bool]]) -> None:
+        """Invoke the callback for one queued result.
 
-    def _resample_audio(self, audio_chunk: bytes) -> bytes:
+        Args:
+            item: Queued result, see _queue_callback
+        """
+        try:
+            if item is None:
+                if self._utterance_end_callback:
+                    self._utterance_end_callback()
+            elif self._transcript_callback:
+                self._transcript_callback(*item)
+        except Exception as e:
+            self._logger.error(f"Error in transcript callback: {e}")
+
+    async def _callback_worker(self) -> None:
+        """Run queued callbacks in order, apart from the receive loop."""
+        queue = self._callback_queue
+        while True:
+            await self._callback_ready.wait()
+            self._callback_ready.clear()
+            while queue:
+                started = time.monotonic()
+                self._run_callback(queue.popleft())
+                elapsed = time.monotonic() - started
+                if elapsed > SLOW_CALLBACK_SECONDS:
+                    self._logger.warning(
+                        "Slow transcript callback (%.0f ms, %d queued behind it)",
+                        elapsed * 1000, len(queue),
+                    )
+
+    def _resample_audio(
+        self, audio_chunk: bytes | bytearray | memoryview
+    ) -> bytes | bytearray | memoryview:
         """Resample audio from input sample rate to 24kHz.
 
         Args:
@@ -212,71 +385,106 @@ class OpenAITranscriber(BaseTranscriber):
         Returns:
             Resampled PCM audio at 24kHz
         """
-        if self.input_sample_rate == self.REQUIRED_SAMPLE_RATE:
+        if self._resampler is None:
             return audio_chunk
 
-        import numpy as np
+        return self._resampler.process(audio_chunk)
+
+    async def send_audio(self, audio_chunk: bytes | bytearray | memoryview) -> None:
+        """Send audio chunk to OpenAI for transcription.
 
-        # Convert bytes to numpy array (16-bit signed integers)
-        samples = np.frombuffer(audio_chunk, dtype=np.int16)
+        Args:
+            audio_chunk: Raw audio data (16-bit PCM, mono)
+        """
+        send_buffer = self._send_buffer
+        if send_buffer is None or not self._connected:
+            self._logger.warning("Not connected to OpenAI, cannot send audio")
+            return
 
-        # Calculate resampling ratio
-        ratio = self.REQUIRED_SAMPLE_RATE / self.input_sample_rate
+        await send_buffer.add(audio_chunk)
 
-        # Simple linear interpolation resampling
-        num_output_samples = int(len(samples) * ratio)
-        indices = np.linspace(0, len(samples) - 1, num_output_samples)
-        resampled = np.interp(indices, np.arange(len(samples)), samples.astype(np.float32))
+    def _encode_audio_event(self, payload: bytes) -> memoryview:
+        """Resample audio and wrap it in an append event.
 
-        # Convert back to 16-bit integers
-        resampled = np.clip(resampled, -32768, 32767).astype(np.int16)
+        The Realtime API only takes audio as base64 inside JSON events, so
+        the event is assembled in a reused buffer that keeps the constant
+        envelope and overwrites just the audio field. The result is a view of
+        that buffer, valid until the next call.
 
-        return resampled.tobytes()
+        Args:
+            payload: Audio data at the input sample rate
 
-    async def send_audio(self, audio_chunk: bytes) -> None:
-        """Send audio chunk to OpenAI for transcription.
+        Returns:
+            Serialized input_audio_buffer.append event
+        """
+        # Resample to 24kHz if needed; the result may be a view of the
+        # resampler's output buffer, which base64 reads without a copy
+        encoded = base64.b64encode(self._resample_audio(payload))
+
+        # base64 output needs no JSON escaping
+        start = len(self._AUDIO_EVENT_PREFIX)
+        end = start + len(encoded)
+        size = end + len(self._AUDIO_EVENT_SUFFIX)
+        if len(self._event_buffer) < size:
+            # A new buffer rather than a resize, since a view of the old one
+            # may still be held
+            self._event_buffer = bytearray(size)
+            self._event_buffer[:start] = self._AUDIO_EVENT_PREFIX
+
+        buffer = self._event_buffer
+        buffer[start:end] = encoded
+        buffer[end:size] = self._AUDIO_EVENT_SUFFIX
+        return memoryview(buffer)[:size]
+
+    async def _send_payload(self, payload: bytes) -> None:
+        """Resample and send a coalesced audio payload as one append event.
 
         Args:
-            audio_chunk: Raw audio data (16-bit PCM, mono)
+            payload: Buffered audio data at the input sample rate
         """
-        if not self._connected or not self._websocket:
-            self._logger.warning("Not connected to OpenAI, cannot send audio")
+        websocket = self._websocket
+        if websocket is None:
             return
 
+        # Encoding runs in a worker thread so the receive loop keeps
+        # draining the socket. The send buffer's sender task is the only
+        # caller and awaits each payload, so payloads (and the resampler's
+        # stream state) stay in order and the event buffer is untouched
+        # until the frame is written.
+        event = await asyncio.to_thread(self._encode_audio_event, payload)
         try:
-            # Resample to 24kHz if needed
-            resampled_audio = self._resample_audio(audio_chunk)
-
-            # Base64 encode the audio
-            audio_base64 = base64.b64encode(resampled_audio).decode("utf-8")
-
-            # Send audio append event
-            event = {
-                "type": "input_audio_buffer.append",
-                "audio": audio_base64,
-            }
-            await self._websocket.send(json.dumps(event))
+            # The Realtime API requires JSON events in text frames
+            await websocket.send(event, text=True)
+        except websockets.exceptions.ConnectionClosed:
+            self._logger.warning("OpenAI connection closed while sending audio")
+            self._connected = False
 
-        except Exception as e:
-            self._logger.error(f"Error sending audio: {e}")
+        # Other errors propagate to the send buffer, which logs them
 
     async def stop_streaming(self) -> None:
         """Close WebSocket connection and cleanup."""
-        if not self._connected:
-            return
-
         try:
             self._connected = False
 
+            # Send any queued and buffered audio, then stop the sender
+            if self._send_buffer:
+                await self._send_buffer.stop()
+                self._send_buffer = None
+
+            self._cancel_interim()
+
             # Cancel receive task
             if self._receive_task:
                 self._receive_task.cancel()
-                try:
-                    await asyncio.wait_for(self._receive_task, timeout=1.0)
-                except (asyncio.TimeoutError, asyncio.CancelledError):
-                    pass
+                await asyncio.wait({self._receive_task}, timeout=1.0)
                 self._receive_task = None
 
+            # Stop the callback worker
+            if self._callback_task:
+                self._callback_task.cancel()
+                await asyncio.wait({self._callback_task}, timeout=1.0)
+                self._callback_task = None
+
             # Close WebSocket
             if self._websocket:
                 await self._websocket.close()
@@ -289,6 +497,7 @@ class OpenAITranscriber(BaseTranscriber):
         finally:
             self._connected = False
             self._websocket = None
+            self._send_buffer = None
 
     @property
     def is_connected(self) -> bool:
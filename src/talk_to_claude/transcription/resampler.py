@@ -0,0 +1,171 @@
+"""Streaming polyphase resampler for 16-bit PCM audio."""
+
+from math import gcd
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+class PolyphaseResampler:
+    """Rational-ratio resampler for a continuous mono int16 stream.
+
+    The input is conceptually upsampled by ``up``, low-pass filtered and
+    decimated by ``down``; only the filter taps that land on real input
+    samples are evaluated (the polyphase form). Filter history and the
+    output phase carry over between chunks, so a stream split into arbitrary
+    chunks resamples exactly as if it were one buffer.
+    """
+
+    # Output plans kept before the cache is reset
+    MAX_PLANS = 8
+
+    def __init__(self, input_rate: int, output_rate: int, taps_per_phase: int = 16):
+        """Initialize the resampler.
+
+        Args:
+            input_rate: Input sample rate in Hz
+            output_rate: Output sample rate in Hz
+            taps_per_phase: Filter taps evaluated per output sample; more
+                taps give a sharper anti-aliasing cutoff
+        """
+        divisor = gcd(input_rate, output_rate)
+        self.up = output_rate // divisor
+        self.down = input_rate // divisor
+        self.taps_per_phase = taps_per_phase
+
+        # Windowed-sinc low-pass prototype at the upsampled rate, cut off at
+        # the lower of the two Nyquist frequencies
+        num_taps = taps_per_phase * self.up
+        cutoff = 1.0 / max(self.up, self.down)
+        n = np.arange(num_taps) - (num_taps - 1) / 2.0
+        prototype = np.sinc(cutoff * n) * np.kaiser(num_taps, 5.0)
+        # Unity gain for each phase
+        prototype *= self.up / prototype.sum()
+
+        # phases[p, k] weights input sample (i - k) for output phase p; taps
+        # are reversed so a forward window of input samples lines up with them
+        phases = prototype.reshape(taps_per_phase, self.up).T
+        self._phases = np.ascontiguousarray(phases[:, ::-1], dtype=np.float32)
+
+        # Output plans keyed by (output position, chunk length)
+        self._plans: dict[tuple[int, int], tuple[int, int, tuple[tuple[int, int], ...]]] = {}
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the stream history, e.g. before a new stream starts."""
+        history_len = self.taps_per_phase - 1
+        # Working buffers, reused across chunks and grown on demand. The
+        # input buffer holds the last (taps_per_phase - 1) samples of the
+        # previous chunk followed by the current chunk.
+        self._input = np.zeros(history_len, dtype=np.float32)
+        self._acc = np.empty(0, dtype=np.float32)
+        self._out_bytes = bytearray()
+        self._out = np.frombuffer(self._out_bytes, dtype=np.int16)
+        # Upsampled-rate position of the next output, relative to the start
+        # of the next chunk
+        self._position = 0
+
+    def process(self, audio_chunk: bytes | bytearray | memoryview) -> memoryview:
+        """Resample one chunk of the stream.
+
+        The result is a view of an internal buffer that the next call
+        overwrites; encode or copy it before resampling more audio.
+
+        Args:
+            audio_chunk: Raw 16-bit mono PCM at the input rate
+
+        Returns:
+            Raw 16-bit mono PCM at the output rate
+        """
+        samples = np.frombuffer(audio_chunk, dtype=np.int16)
+        num_in = len(samples)
+        if not num_in:
+            return memoryview(b"")
+
+        history_len = self.taps_per_phase - 1
+        num_out, advance, slots = self._plan(num_in)
+        self._reserve(num_in, num_out)
+
+        # Append the chunk after the carried-over history
+        extended = self._input[:history_len + num_in]
+        extended[history_len:] = samples
+
+        # Row i is the window of taps_per_phase inputs starting at i, as a
+        # strided view with no copy
+        windows = sliding_window_view(extended, self.taps_per_phase)
+        resampled = self._acc[:num_out]
+        for slot, (first_window, phase) in enumerate(slots):
+            # Every up-th output shares a phase and steps down inputs, so
+            # each slot is one strided matrix-vector product
+            rows = windows[first_window::self.down][:len(range(slot, num_out, self.up))]
+            np.matmul(rows, self._phases[phase], out=resampled[slot::self.up])
+
+        # Keep the tail as history for the next chunk
+        extended[:history_len] = extended[num_in:]
+        self._position += advance
+
+        # Clip in place, then round straight into the int16 output, so the
+        # float results are walked twice rather than three times
+        np.clip(resampled, -32768, 32767, out=resampled)
+        np.rint(resampled, out=self._out[:num_out], casting="unsafe")
+        return memoryview(self._out_bytes)[:num_out * 2]
+
+    def _reserve(self, num_in: int, num_out: int) -> None:
+        """Grow the working buffers to fit a chunk.
+
+        Args:
+            num_in: Number of input samples in the chunk
+            num_out: Number of output samples for the chunk
+        """
+        history_len = self.taps_per_phase - 1
+        if len(self._input) < history_len + num_in:
+            grown = np.empty(history_len + num_in, dtype=np.float32)
+            grown[:history_len] = self._input[:history_len]
+            self._input = grown
+
+        if len(self._acc) < num_out:
+            self._acc = np.empty(num_out, dtype=np.float32)
+            # A new bytearray rather than a resize, since views of the old
+            # one may still be held
+            self._out_bytes = bytearray(num_out * 2)
+            self._out = np.frombuffer(self._out_bytes, dtype=np.int16)
+
+    def _plan(self, num_in: int) -> tuple[int, int, tuple[tuple[int, int], ...]]:
+        """Get the output layout for a chunk at the current phase.
+
+        Outputs repeat their filter phase every ``up`` outputs, so a chunk
+        splits into at most ``up`` slots that each use one phase. Chunks
+        almost always have the same length and the starting position cycles
+        through fewer than ``down`` values, so plans are computed once and
+        reused.
+
+        Args:
+            num_in: Number of input samples in the chunk
+
+        Returns:
+            Tuple of (output count, change in output position, and per slot
+            the first window row and the filter phase)
+        """
+        key = (self._position, num_in)
+        plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+
+        # Outputs whose newest input sample falls in this chunk
+        span = num_in * self.up
+        num_out = max(0, -(-(span - self._position) // self.down))
+
+        slots = []
+        for slot in range(min(self.up, num_out)):
+            position = self._position + slot * self.down
+            # Window row n (chunk index of the newest input) ends on that
+            # input, since the history sits in front of the chunk
+            slots.append((position // self.up, position % self.up))
+
+        plan = (num_out, num_out * self.down - span, tuple(slots))
+
+        if len(self._plans) >= self.MAX_PLANS:
+            self._plans.clear()
+        self._plans[key] = plan
+        return plan
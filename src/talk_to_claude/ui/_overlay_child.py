@@ -0,0 +1,548 @@
+"""Overlay window process, run by TranscriptOverlay with python -m.
+
+Only the overlay process imports this module, so AppKit is imported at
+module scope and the names used by the event loop are plain globals.
+"""
+
+import json
+import signal
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import BinaryIO
+
+from AppKit import (
+    NSApplication,
+    NSColor,
+    NSFont,
+    NSMakeRect,
+    NSScreen,
+    NSTextField,
+    NSWindow,
+    NSWindowStyleMaskBorderless,
+    NSStatusWindowLevel,
+    NSApplicationDefined,
+    NSDate,
+    NSEventMaskAny,
+    NSView,
+    NSCursor,
+    NSEvent,
+    NSLeftMouseDown,
+    NSLeftMouseUp,
+    NSLeftMouseDragged,
+    NSScrollWheel,
+)
+from Foundation import NSPoint, NSSize
+import objc
+
+from .overlay import (
+    _HEADER,
+    _UPDATE,
+    _LISTENING,
+    _CLEAR,
+    _SHOW,
+    _HIDE,
+    _OPACITY,
+    _STOP,
+    SAVE_INTERVAL,
+    DEFAULT_SETTINGS,
+    _ensure_settings_dir,
+    _decode_command,
+    _load_settings,
+    _save_settings,
+)
+
+# Commands applied per wake-up before UI events get a turn again
+MAX_COMMANDS_PER_WAKE = 64
+
+
+def _read_command(stream: BinaryIO) -> tuple[int, bool, object]:
+    """Read and decode one command frame.
+
+    Args:
+        stream: Binary stream of frames from the parent
+
+    Returns:
+        Tuple of (action ID, flag, text or opacity or None)
+
+    Raises:
+        EOFError: If the parent closed the stream
+    """
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        raise EOFError("Command stream closed")
+    length = _HEADER.unpack_from(header)[2]
+    payload = stream.read(length) if length else b""
+    if len(payload) < length:
+        raise EOFError("Command stream closed")
+    return _decode_command(header + payload)
+
+
+def run(
+    stream: BinaryIO,
+    position: str,
+    width: int,
+    height: int,
+    font_size: int,
+    default_opacity: float,
+    min_width: int,
+    min_height: int,
+    remember_position: bool,
+) -> None:
+    """Run the overlay on this process's main thread until told to stop.
+
+    Args:
+        stream: Binary stream of command frames from the parent
+        position: Default position preset
+        width: Default window width
+        height: Default window height
+        font_size: Font size for transcript text
+        default_opacity: Default window opacity (0.3-1.0)
+        min_width: Minimum window width
+        min_height: Minimum window height
+        remember_position: Whether to persist window position/size/opacity
+    """
+
+    POSITIONS = {
+        "top-left": (20, -80),
+        "top-right": (-420, -80),
+        "bottom-left": (20, 80),
+        "bottom-right": (-420, 80),
+    }
+
+    # Load saved settings
+    saved_settings = _load_settings() if remember_position else DEFAULT_SETTINGS.copy()
+    if remember_position:
+        _ensure_settings_dir()
+
+    # Current state
+    current_opacity = saved_settings.get("opacity", default_opacity)
+
+    # Initialize application
+    app = NSApplication.sharedApplication()
+
+    # Colors are looked up once instead of through the bridge on every
+    # update; background colors are cached per 1/40 step of opacity
+    final_text_color = NSColor.greenColor()
+    interim_text_color = NSColor.whiteColor()
+    listening_text_color = NSColor.cyanColor()
+    background_colors = {}
+
+    def background_color(opacity):
+        """Get the window background color for an opacity."""
+        level = round(opacity * 40)
+        color = background_colors.get(level)
+        if color is None:
+            color = NSColor.colorWithCalibratedRed_green_blue_alpha_(0, 0, 0, level / 40)
+            background_colors[level] = color
+        return color
+
+    # Get screen dimensions
+    screen = NSScreen.mainScreen()
+    screen_frame = screen.frame()
+
+    # Determine initial position
+    if remember_position and saved_settings.get("x") is not None and saved_settings.get("y") is not None:
+        # Use saved position
+        x = saved_settings["x"]
+        y = saved_settings["y"]
+        width = saved_settings.get("width", width)
+        height = saved_settings.get("height", height)
+    else:
+        # Calculate window position from preset
+        x_offset, y_offset = POSITIONS.get(position, POSITIONS["top-right"])
+
+        if x_offset < 0:
+            x = screen_frame.size.width + x_offset
+        else:
+            x = x_offset
+
+        if y_offset < 0:
+            y = screen_frame.size.height + y_offset
+        else:
+            y = y_offset
+
+    # Skip custom view for resize handle - use simple NSView instead
+    # The resize functionality still works via mouse event handling
+
+    # Create window
+    rect = NSMakeRect(x, y, width, height)
+    window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
+        rect,
+        NSWindowStyleMaskBorderless,
+        2,  # NSBackingStoreBuffered
+        False,
+    )
+
+    # Configure window
+    window.setLevel_(NSStatusWindowLevel)
+    window.setOpaque_(False)
+    window.setBackgroundColor_(background_color(current_opacity))
+    window.setHasShadow_(True)
+    window.setCollectionBehavior_(1 << 6)  # NSWindowCollectionBehaviorCanJoinAllSpaces
+
+    # Make window draggable by background and allow mouse events
+    window.setMovableByWindowBackground_(True)
+    window.setIgnoresMouseEvents_(False)
+
+    # Set minimum and maximum size constraints
+    window.setMinSize_(NSSize(min_width, min_height))
+    window.setMaxSize_(NSSize(screen_frame.size.width, screen_frame.size.height / 2))
+
+    # Create content view with rounded corners
+    content_view = window.contentView()
+    content_view.setWantsLayer_(True)
+    content_view.layer().setCornerRadius_(10)
+
+    # Create text field
+    text_rect = NSMakeRect(15, 10, width - 50, height - 20)  # Leave space for resize handle
+    text_field = NSTextField.alloc().initWithFrame_(text_rect)
+    text_field.setBezeled_(False)
+    text_field.setDrawsBackground_(False)
+    text_field.setEditable_(False)
+    text_field.setSelectable_(False)
+    text_field.setTextColor_(listening_text_color)
+    text_field.setFont_(NSFont.systemFontOfSize_(font_size))
+    text_field.setStringValue_("Listening...")
+
+    content_view.addSubview_(text_field)
+
+    # Create simple resize handle view in bottom-right corner
+    # Using standard NSView - the grip is indicated by cursor change on hover
+    resize_handle = NSView.alloc().initWithFrame_(NSMakeRect(width - 20, 0, 20, 20))
+    content_view.addSubview_(resize_handle)
+
+    # Show window
+    window.orderFrontRegardless()
+
+    # Track resize state
+    is_resizing = False
+    resize_start_point = None
+    resize_start_size = None
+
+    # Settings writes are debounced, so a drag or scroll writes the file
+    # at most once per SAVE_INTERVAL and once more when it ends
+    settings_dirty = False
+    last_save_time = 0.0
+
+    def save_current_settings():
+        """Mark the current window settings as needing a save."""
+        nonlocal settings_dirty
+        settings_dirty = remember_position
+
+    def flush_settings(force=False):
+        """Write the window settings if they changed.
+
+        Args:
+            force: Write even if the last write was under SAVE_INTERVAL ago
+        """
+        nonlocal settings_dirty, last_save_time
+        if not settings_dirty:
+            return
+        now = time.monotonic()
+        if not force and now - last_save_time < SAVE_INTERVAL:
+            return
+
+        frame = window.frame()
+        # Plain floats, which orjson serializes natively
+        settings = {
+            "x": float(frame.origin.x),
+            "y": float(frame.origin.y),
+            "width": float(frame.size.width),
+            "height": float(frame.size.height),
+            "opacity": float(current_opacity),
+        }
+        _save_settings(settings)
+        settings_dirty = False
+        last_save_time = now
+
+    def update_text_field_frame():
+        """Update text field frame when window is resized."""
+        frame = window.frame()
+        text_field.setFrame_(NSMakeRect(15, 10, frame.size.width - 50, frame.size.height - 20))
+        # Update resize handle position
+        resize_handle.setFrame_(NSMakeRect(frame.size.width - 20, 0, 20, 20))
+
+    def point_in_resize_zone(point, frame):
+        """Check if point is in the resize zone (bottom-right corner)."""
+        resize_zone_size = 20
+        return (point.x >= frame.size.width - resize_zone_size and
+                point.y <= resize_zone_size)
+
+    def handle_scroll_event(event):
+        """Handle scroll wheel event to adjust opacity."""
+        nonlocal current_opacity
+
+        # Get scroll delta (positive = scroll up = more opaque)
+        delta = event.scrollingDeltaY()
+
+        # Adjust opacity (0.05 per scroll unit)
+        new_opacity = current_opacity + (delta * 0.02)
+        new_opacity = max(0.3, min(1.0, new_opacity))  # Clamp between 0.3 and 1.0
+
+        if new_opacity != current_opacity:
+            current_opacity = new_opacity
+            window.setBackgroundColor_(background_color(current_opacity))
+            save_current_settings()
+
+    # Commands are read by a background thread, which wakes the event loop
+    # with an application-defined event; the loop itself blocks until an
+    # event arrives instead of polling
+    pending_commands: deque = deque()
+    wake_posted = threading.Event()
+
+    def post_wake_event():
+        """Wake the event loop to apply pending commands."""
+        with objc.autorelease_pool():
+            wake_event = NSEvent.otherEventWithType_location_modifierFlags_timestamp_windowNumber_context_subtype_data1_data2_(
+                NSApplicationDefined, NSPoint(0, 0), 0, 0, 0, None, 0, 0, 0
+            )
+            app.postEvent_atStart_(wake_event, False)
+
+    def read_commands():
+        """Move commands from the parent onto the pending list (reader thread)."""
+        while True:
+            try:
+                cmd = _read_command(stream)
+            except Exception:
+                # Parent went away; shut down
+                cmd = (_STOP, False, None)
+
+            pending_commands.append(cmd)
+            if not wake_posted.is_set():
+                wake_posted.set()
+                post_wake_event()
+
+            if cmd[0] == _STOP:
+                return
+
+    # What the text field currently shows, so repeated updates don't
+    # invalidate and redraw it; colors are cached objects, compared by identity
+    shown_text = "Listening..."
+    shown_color = listening_text_color
+
+    def set_text(text, color=None):
+        """Set the text field's string and color, skipping unchanged values."""
+        nonlocal shown_text, shown_color
+        if text != shown_text:
+            text_field.setStringValue_(text)
+            shown_text = text
+        if color is not None and color is not shown_color:
+            text_field.setTextColor_(color)
+            shown_color = color
+
+    def show_update(is_final, text):
+        """Display a transcript update."""
+        if not is_final and text:
+            text = f"... {text}"
+        set_text(text, final_text_color if is_final else interim_text_color)
+
+    def show_listening(listening, _):
+        """Show or clear the listening indicator."""
+        if listening:
+            set_text("Listening...", listening_text_color)
+        else:
+            set_text("")
+
+    def clear_text(_, __):
+        """Clear the displayed text."""
+        set_text("")
+
+    def show_window(_, __):
+        """Bring the window to the front."""
+        window.orderFrontRegardless()
+
+    def hide_window(_, __):
+        """Hide the window."""
+        window.orderOut_(None)
+
+    def set_opacity(_, opacity):
+        """Set the background opacity."""
+        nonlocal current_opacity
+        current_opacity = max(0.3, min(1.0, opacity))
+        window.setBackgroundColor_(background_color(current_opacity))
+        save_current_settings()
+
+    # Command handlers indexed by action ID; stop is handled by the caller
+    handlers = [None] * (_STOP + 1)
+    handlers[_UPDATE] = show_update
+    handlers[_LISTENING] = show_listening
+    handlers[_CLEAR] = clear_text
+    handlers[_SHOW] = show_window
+    handlers[_HIDE] = hide_window
+    handlers[_OPACITY] = set_opacity
+    handlers = tuple(handlers)
+
+    def apply_commands() -> bool:
+        """Apply pending commands.
+
+        Returns:
+            False once a stop command is seen
+        """
+        # Clear before draining, so a command appended after the drain
+        # always posts a new wake event
+        wake_posted.clear()
+
+        # Take the pending batch first: only the newest transcript is
+        # visible, so an interim update followed by another update in the
+        # same batch is skipped rather than rendered. The batch is bounded
+        # so a flood of commands can't starve UI events; anything left over
+        # gets another wake-up behind them.
+        count = min(len(pending_commands), MAX_COMMANDS_PER_WAKE)
+        commands = [pending_commands.popleft() for _ in range(count)]
+        if pending_commands and not wake_posted.is_set():
+            wake_posted.set()
+            post_wake_event()
+
+        last_update = -1
+        for i, (action, _, _) in enumerate(commands):
+            if action == _UPDATE:
+                last_update = i
+
+        for i, (action, flag, value) in enumerate(commands):
+            if action == _STOP:
+                return False
+            if action == _UPDATE and not flag and i < last_update:
+                continue
+            # A failing command must not take the rest of the batch with it
+            try:
+                handlers[action](flag, value)
+            except Exception:
+                # stderr is inherited from the daemon, so this lands in its log
+                traceback.print_exc()
+
+        return True
+
+    threading.Thread(target=read_commands, name="overlay-reader", daemon=True).start()
+
+    running = True
+    wait_forever = NSDate.distantFuture()
+    no_wait = NSDate.distantPast()
+
+    def frame_bounds(frame):
+        """Get (left, bottom, right, top) of a frame as plain floats."""
+        return (
+            frame.origin.x,
+            frame.origin.y,
+            frame.origin.x + frame.size.width,
+            frame.origin.y + frame.size.height,
+        )
+
+    # Track window movement for saving. The bounds of the last seen frame
+    # serve the scroll hit test, so scrolling doesn't query the window.
+    last_frame = window.frame()
+    left, bottom, right, top = frame_bounds(last_frame)
+
+    while running:
+        # Block until a UI event or a command wake-up arrives, or until a
+        # debounced settings write is due
+        if settings_dirty:
+            remaining = SAVE_INTERVAL - (time.monotonic() - last_save_time)
+            wait_until = NSDate.dateWithTimeIntervalSinceNow_(max(0.0, remaining))
+        else:
+            wait_until = wait_forever
+        event = app.nextEventMatchingMask_untilDate_inMode_dequeue_(
+            NSEventMaskAny,
+            wait_until,
+            "NSDefaultRunLoopMode",
+            True
+        )
+
+        # Handle every event that is already queued before checking the
+        # frame, so a burst of scroll or drag events is worked off at once
+        mouse_released = False
+        while event is not None and running:
+            event_type = event.type()
+
+            if event_type == NSApplicationDefined:
+                running = apply_commands()
+
+            elif event_type == NSScrollWheel:
+                # Check if scroll is over our window
+                mouse_location = NSEvent.mouseLocation()
+                if left <= mouse_location.x <= right and bottom <= mouse_location.y <= top:
+                    handle_scroll_event(event)
+
+            elif event_type == NSLeftMouseDown:
+                # Check if click is in resize zone
+                location = event.locationInWindow()
+                frame = window.frame()
+                if point_in_resize_zone(location, frame):
+                    is_resizing = True
+                    resize_start_point = NSEvent.mouseLocation()
+                    resize_start_size = (frame.size.width, frame.size.height)
+                    NSCursor.resizeDiagonalCursor().push()
+                else:
+                    # Let the window handle normal dragging
+                    app.sendEvent_(event)
+
+            elif event_type == NSLeftMouseDragged:
+                if is_resizing and resize_start_point and resize_start_size:
+                    current_point = NSEvent.mouseLocation()
+                    delta_x = current_point.x - resize_start_point.x
+                    delta_y = resize_start_point.y - current_point.y  # Invert Y for bottom-right resize
+
+                    new_width = max(min_width, resize_start_size[0] + delta_x)
+                    new_height = max(min_height, resize_start_size[1] + delta_y)
+
+                    # Get current origin and adjust for height change (keep top-left corner fixed)
+                    current_frame = window.frame()
+                    new_y = current_frame.origin.y + current_frame.size.height - new_height
+
+                    window.setFrame_display_(
+                        NSMakeRect(current_frame.origin.x, new_y, new_width, new_height),
+                        True
+                    )
+                else:
+                    app.sendEvent_(event)
+
+            elif event_type == NSLeftMouseUp:
+                if is_resizing:
+                    is_resizing = False
+                    resize_start_point = None
+                    resize_start_size = None
+                    NSCursor.pop()
+                    save_current_settings()
+                else:
+                    app.sendEvent_(event)
+
+            else:
+                app.sendEvent_(event)
+
+            if event_type == NSLeftMouseUp:
+                mouse_released = True
+            event = app.nextEventMatchingMask_untilDate_inMode_dequeue_(
+                NSEventMaskAny,
+                no_wait,
+                "NSDefaultRunLoopMode",
+                True
+            )
+
+        # Check for window movement/resize and save settings
+        current_frame = window.frame()
+        if (current_frame.origin.x != last_frame.origin.x or
+            current_frame.origin.y != last_frame.origin.y or
+            current_frame.size.width != last_frame.size.width or
+            current_frame.size.height != last_frame.size.height):
+            update_text_field_frame()
+            save_current_settings()
+            last_frame = current_frame
+            left, bottom, right, top = frame_bounds(current_frame)
+
+        # A finished drag or resize is written straight away
+        flush_settings(force=mouse_released)
+
+    flush_settings(force=True)
+
+
+def main() -> None:
+    """Entry point: settings come as a JSON object in the first argument."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    options = json.loads(sys.argv[1])
+    run(sys.stdin.buffer, **options)
+
+
+if __name__ == "__main__":
+    main()
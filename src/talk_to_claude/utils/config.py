@@ -1,32 +1,86 @@
 """Configuration management for Talk to Claude."""
 
-import json
+import copy
 import os
+import pickle
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable
 
+import orjson
 import yaml
 from dotenv import load_dotenv
 
 # API keys configuration file
 API_KEYS_FILE = Path.home() / ".claude_voice_api.json"
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed files by path, with the mtime they were parsed at
+_FILE_CACHE: dict[str, tuple[int, Any]] = {}
+
+
+def _read_cached(path: Path, parse: Callable[[bytes], Any]) -> Any:
+    """Parse a file, reusing the result while its mtime is unchanged.
+
+    Args:
+        path: File to read
+        parse: Function that parses the file's contents
+
+    Returns:
+        A deep copy of the parsed content, safe for the caller to modify
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    key = str(path)
+    mtime = path.stat().st_mtime_ns
+    cached = _FILE_CACHE.get(key)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, parse(path.read_bytes()))
+        _FILE_CACHE[key] = cached
+    return copy.deepcopy(cached[1])
+
+
+def _parse_yaml(data: bytes) -> Any:
+    """Parse YAML with the fastest available safe loader."""
+    return yaml.load(data, Loader=_YAML_LOADER)
+
+
+def _freeze(value: Any) -> Any:
+    """Make a read-only copy of a config tree.
+
+    Args:
+        value: Config value; dicts and lists are converted recursively
+
+    Returns:
+        The value with dicts as MappingProxyType and lists as tuples
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 
 class Config:
     """Configuration manager that loads from YAML and environment variables."""
 
-    DEFAULT_CONFIG = {
+    _DEFAULTS = {
         "transcription": {
             "service": "deepgram",
             "api_key": None,  # Must be set via DEEPGRAM_API_KEY env var
             "model": "nova-2-general",
             "language": "en-US",
             "interim_results": True,
+            "send_buffer_bytes": 3200,
         },
         "audio": {
             "sample_rate": 16000,
             "channels": 1,
             "chunk_duration_ms": 100,
+            "batch_factor": 1,
         },
         "feedback": {
             "show_live_transcript": True,
@@ -40,6 +94,7 @@ class Config:
                 "go to {position} pane",
                 "switch to {position}",
             ],
+            "max_buffer_chars": 4096,
         },
         "daemon": {
             "pid_file": "~/.talk-to-claude/daemon.pid",
@@ -48,6 +103,14 @@ class Config:
         },
     }
 
+    # Each load starts from a fresh mutable copy of the defaults; unpickling
+    # is cheaper than deepcopy for a tree of plain dicts, lists and scalars
+    _DEFAULT_CONFIG_PICKLE = pickle.dumps(_DEFAULTS, protocol=5)
+
+    # Read-only view of the defaults
+    DEFAULT_CONFIG = _freeze(_DEFAULTS)
+    del _DEFAULTS
+
     def __init__(self, config_path: str | Path | None = None):
         """Initialize configuration.
 
@@ -58,10 +121,12 @@ class Config:
         self._config = self._load_config(config_path)
         self._resolve_env_vars()
         self._expand_paths()
+        self._flat = self._flatten(self._config)
+        self._directories_ready = False
 
     def _load_config(self, config_path: str | Path | None) -> dict[str, Any]:
         """Load configuration from file or use defaults."""
-        config = self.DEFAULT_CONFIG.copy()
+        config = pickle.loads(self._DEFAULT_CONFIG_PICKLE)
 
         if config_path is None:
             # Try default locations
@@ -75,21 +140,33 @@ class Config:
                     break
 
         if config_path and Path(config_path).exists():
-            with open(config_path) as f:
-                user_config = yaml.safe_load(f) or {}
-            config = self._deep_merge(config, user_config)
+            user_config = _read_cached(Path(config_path), _parse_yaml) or {}
+            self._deep_merge(config, user_config)
 
         return config
 
     def _deep_merge(self, base: dict, override: dict) -> dict:
-        """Deep merge two dictionaries."""
-        result = base.copy()
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
-            else:
-                result[key] = value
-        return result
+        """Deep merge one dictionary into another in place.
+
+        Args:
+            base: Dictionary to merge into; modified
+            override: Dictionary whose values take precedence; its values
+                are placed into base without copying
+
+        Returns:
+            base, with override merged in
+        """
+        # Walk matching sub-dicts with an explicit stack
+        stack = [(base, override)]
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                current = dst.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    dst[key] = value
+        return base
 
     def _load_api_keys(self) -> dict[str, str]:
         """Load API keys from ~/.claude_voice_api.json.
@@ -99,9 +176,8 @@ class Config:
         """
         if API_KEYS_FILE.exists():
             try:
-                with open(API_KEYS_FILE) as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
+                return _read_cached(API_KEYS_FILE, orjson.loads)
+            except (orjson.JSONDecodeError, IOError):
                 pass
         return {}
 
@@ -135,9 +211,36 @@ class Config:
             if daemon_config.get(key):
                 daemon_config[key] = str(Path(daemon_config[key]).expanduser())
 
+    @staticmethod
+    def _flatten(config: dict) -> dict[str, Any]:
+        """Index every value in the config by its dotted key.
+
+        Sections are included as well as leaves, so "transcription" and
+        "transcription.api_key" are both keys.
+
+        Args:
+            config: Nested configuration
+
+        Returns:
+            Flat dictionary of dotted keys to values
+        """
+        flat = {}
+        stack = [("", config)]
+        while stack:
+            prefix, section = stack.pop()
+            for key, value in section.items():
+                dotted = f"{prefix}{key}"
+                flat[dotted] = value
+                if isinstance(value, dict):
+                    stack.append((f"{dotted}.", value))
+        return flat
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value using dot notation.
 
+        Values are looked up in an index built at load time, so changes
+        made through the section dicts afterwards are not reflected.
+
         Args:
             key: Configuration key in dot notation (e.g., "transcription.api_key")
             default: Default value if key not found
@@ -145,14 +248,7 @@ class Config:
         Returns:
             Configuration value or default
         """
-        keys = key.split(".")
-        value = self._config
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(key, default)
 
     def __getitem__(self, key: str) -> Any:
         """Get a top-level configuration section."""
@@ -184,7 +280,13 @@ class Config:
         return self._config["daemon"]
 
     def ensure_directories(self) -> None:
-        """Ensure all required directories exist."""
-        for key in ["pid_file", "log_file", "socket_path"]:
-            path = Path(self.daemon[key])
-            path.parent.mkdir(parents=True, exist_ok=True)
+        """Ensure all required directories exist.
+
+        Each distinct directory is created once; later calls do nothing.
+        """
+        if self._directories_ready:
+            return
+        parents = {Path(self.daemon[key]).parent for key in ["pid_file", "log_file", "socket_path"]}
+        for parent in parents:
+            parent.mkdir(parents=True, exist_ok=True)
+        self._directories_ready = True
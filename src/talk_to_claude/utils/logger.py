@@ -5,17 +5,30 @@ import sys
 from pathlib import Path
 
 
-_loggers: dict[str, logging.Logger] = {}
+# Package logger; component loggers are its children and share its handlers
+ROOT_LOGGER = "talk_to_claude"
+
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Logger name -> (log_file, level, console) it was first configured with
+_configured: dict[str, tuple[Path | None, int, bool]] = {}
 
 
 def setup_logger(
-    name: str = "talk_to_claude",
+    name: str = ROOT_LOGGER,
     log_file: str | Path | None = None,
     level: int = logging.INFO,
     console: bool = True,
 ) -> logging.Logger:
     """Set up and configure a logger.
 
+    Handlers are installed on the first call for each name only; later
+    calls for that name return the already configured logger, with a
+    warning if they asked for a different configuration.
+
     Args:
         name: Logger name
         log_file: Path to log file (optional)
@@ -26,22 +39,27 @@ def setup_logger(
         Configured logger instance
     """
     logger = logging.getLogger(name)
+    settings = (Path(log_file) if log_file else None, level, console)
+    previous = _configured.get(name)
+    if previous is not None:
+        if previous != settings:
+            logger.warning(
+                f"Logger {name!r} is already configured; "
+                "ignoring the new logging settings"
+            )
+        return logger
+    _configured[name] = settings
+
     logger.setLevel(level)
 
     # Clear existing handlers
     logger.handlers.clear()
 
-    # Create formatter
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
     # Console handler
     if console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
-        console_handler.setFormatter(formatter)
+        console_handler.setFormatter(_FORMATTER)
         logger.addHandler(console_handler)
 
     # File handler
@@ -50,22 +68,24 @@ def setup_logger(
         log_path.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_path)
         file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
 
-    _loggers[name] = logger
     return logger
 
 
-def get_logger(name: str = "talk_to_claude") -> logging.Logger:
-    """Get an existing logger or create a new one.
+def get_logger(name: str = ROOT_LOGGER) -> logging.Logger:
+    """Get a logger under the package logger.
+
+    Component loggers propagate to the package logger rather than getting
+    handlers of their own, so they follow its level and outputs.
 
     Args:
-        name: Logger name
+        name: Logger name, e.g. "transcription.openai"
 
     Returns:
         Logger instance
     """
-    if name in _loggers:
-        return _loggers[name]
-    return setup_logger(name)
+    if name != ROOT_LOGGER and not name.startswith(ROOT_LOGGER + "."):
+        name = f"{ROOT_LOGGER}.{name}"
+    return logging.getLogger(name)
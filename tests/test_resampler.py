@@ -0,0 +1,86 @@
+"""Tests for the streaming polyphase resampler."""
+
+from itertools import accumulate
+
+import numpy as np
+import pytest
+
+from talk_to_claude.transcription.resampler import PolyphaseResampler
+
+OUTPUT_RATE = 24000
+
+# Irregular chunk sizes, so the phase at each chunk boundary varies
+CHUNK_SIZES = [1, 7, 160, 1024, 333, 2, 4096, 511, 1600, 89]
+
+
+def make_signal(num_samples: int) -> bytes:
+    """Build a repeatable int16 test signal: a tone plus noise, near full scale."""
+    rng = np.random.default_rng(1234)
+    t = np.arange(num_samples)
+    tone = 20000 * np.sin(2 * np.pi * t / 37.0)
+    noise = rng.integers(-8000, 8000, num_samples)
+    return np.clip(tone + noise, -32768, 32767).astype(np.int16).tobytes()
+
+
+def expected_length(resampler: PolyphaseResampler, num_in: int) -> int:
+    """Outputs produced after num_in inputs: ceil(num_in * up / down)."""
+    return -(-num_in * resampler.up // resampler.down)
+
+
+@pytest.mark.parametrize("input_rate", [8000, 16000, 22050, 44100, 48000])
+def test_chunked_output_matches_whole_buffer(input_rate):
+    """Chunked resampling is bit-identical to resampling the whole stream."""
+    audio = make_signal(sum(CHUNK_SIZES))
+
+    whole = bytes(PolyphaseResampler(input_rate, OUTPUT_RATE).process(audio))
+
+    resampler = PolyphaseResampler(input_rate, OUTPUT_RATE)
+    chunked = bytearray()
+    offset = 0
+    for size in CHUNK_SIZES:
+        chunk = audio[offset * 2:(offset + size) * 2]
+        offset += size
+        chunked += resampler.process(chunk)
+
+    assert bytes(chunked) == whole
+
+
+@pytest.mark.parametrize("input_rate", [8000, 16000, 22050, 44100, 48000])
+def test_output_lengths(input_rate):
+    """Each chunk yields exactly the outputs whose newest input it contains."""
+    resampler = PolyphaseResampler(input_rate, OUTPUT_RATE)
+    audio = make_signal(sum(CHUNK_SIZES) * 2)
+    sizes = CHUNK_SIZES * 2
+
+    produced = 0
+    offset = 0
+    for size, total_in in zip(sizes, accumulate(sizes)):
+        chunk = audio[offset * 2:(offset + size) * 2]
+        offset += size
+        produced += len(resampler.process(chunk)) // 2
+        assert produced == expected_length(resampler, total_in)
+
+
+def test_reset_restarts_the_stream():
+    """After reset, output matches a freshly created resampler."""
+    audio = make_signal(2000)
+
+    resampler = PolyphaseResampler(44100, OUTPUT_RATE)
+    resampler.process(audio[:999 * 2])
+    resampler.reset()
+
+    fresh = PolyphaseResampler(44100, OUTPUT_RATE)
+    assert bytes(resampler.process(audio)) == bytes(fresh.process(audio))
+
+
+def test_empty_chunk():
+    """An empty chunk produces nothing and leaves the stream unchanged."""
+    audio = make_signal(500)
+
+    resampler = PolyphaseResampler(22050, OUTPUT_RATE)
+    first = bytes(resampler.process(audio[:201 * 2]))
+    assert len(resampler.process(b"")) == 0
+    rest = bytes(resampler.process(audio[201 * 2:]))
+
+    fresh = PolyphaseResampler(22050, OUTPUT_RATE)
+    assert first + rest == bytes(fresh.process(audio))